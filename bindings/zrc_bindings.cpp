@@ -1,10 +1,10 @@
-// Minimal pybind11 bindings for Zoom Rooms SDK
-// Only exposes core functionality without complex sink trampolines
+// Minimal nanobind bindings for Zoom Rooms SDK
+// Only exposes core functionality; the sinks that forward SDK callbacks to
+// plain Python objects live in zrc_service.cpp
 
-#include <pybind11/pybind11.h>
-#include <pybind11/stl.h>
-#include <map>
-#include <memory>
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
 
 // SDK headers
 #include "IZRCSDK.h"
@@ -13,262 +13,94 @@
 #include "IPreMeetingService.h"
 #include "ZRCSDKTypes.h"
 
-namespace py = pybind11;
-using namespace ZRCSDK;
-
-// Simple concrete implementation of IZRCSDKSink for use from C++
-// Python will not subclass this - we create it in C++
-class SimpleSinkImpl : public IZRCSDKSink {
-private:
-    py::object py_sink;
-
-public:
-    SimpleSinkImpl(py::object obj) : py_sink(obj) {}
-
-    std::string OnGetDeviceManufacturer() override {
-        if (py::hasattr(py_sink, "OnGetDeviceManufacturer")) {
-            return py_sink.attr("OnGetDeviceManufacturer")().cast<std::string>();
-        }
-        return "ZRC_Wrapper";
-    }
-
-    std::string OnGetDeviceModel() override {
-        if (py::hasattr(py_sink, "OnGetDeviceModel")) {
-            return py_sink.attr("OnGetDeviceModel")().cast<std::string>();
-        }
-        return "v1.0";
-    }
-
-    std::string OnGetDeviceSerialNumber() override {
-        if (py::hasattr(py_sink, "OnGetDeviceSerialNumber")) {
-            return py_sink.attr("OnGetDeviceSerialNumber")().cast<std::string>();
-        }
-        return "0000";
-    }
-
-    std::string OnGetDeviceMacAddress() override {
-        if (py::hasattr(py_sink, "OnGetDeviceMacAddress")) {
-            return py_sink.attr("OnGetDeviceMacAddress")().cast<std::string>();
-        }
-        return "00:00:00:00:00:00";
-    }
-
-    std::string OnGetDeviceIP() override {
-        if (py::hasattr(py_sink, "OnGetDeviceIP")) {
-            return py_sink.attr("OnGetDeviceIP")().cast<std::string>();
-        }
-        return "0.0.0.0";
-    }
-
-    std::string OnGetFirmwareVersion() override {
-        if (py::hasattr(py_sink, "OnGetFirmwareVersion")) {
-            return py_sink.attr("OnGetFirmwareVersion")().cast<std::string>();
-        }
-        return "1.0.0";
-    }
-
-    std::string OnGetAppName() override {
-        if (py::hasattr(py_sink, "OnGetAppName")) {
-            return py_sink.attr("OnGetAppName")().cast<std::string>();
-        }
-        return "ZRC_Wrapper";
-    }
-
-    std::string OnGetAppVersion() override {
-        if (py::hasattr(py_sink, "OnGetAppVersion")) {
-            return py_sink.attr("OnGetAppVersion")().cast<std::string>();
-        }
-        return "1.0.0";
-    }
-
-    std::string OnGetAppDeveloper() override {
-        if (py::hasattr(py_sink, "OnGetAppDeveloper")) {
-            return py_sink.attr("OnGetAppDeveloper")().cast<std::string>();
-        }
-        return "Custom";
-    }
+#include "zrc_service.h"
 
-    std::string OnGetAppContact() override {
-        if (py::hasattr(py_sink, "OnGetAppContact")) {
-            return py_sink.attr("OnGetAppContact")().cast<std::string>();
-        }
-        return "support@example.com";
-    }
-
-    std::string OnGetAppContentDirPath() override {
-        if (py::hasattr(py_sink, "OnGetAppContentDirPath")) {
-            return py_sink.attr("OnGetAppContentDirPath")().cast<std::string>();
-        }
-        // Fallback: use /root/.zoom/data (contains third_zrc_data.db with room credentials)
-        return "/root/.zoom/data";
-    }
-
-    bool OnPromptToInputUserNamePasswordForProxyServer(const std::string& proxyHost, uint32_t port, const std::string& description) override {
-        return false;  // Don't prompt for proxy
-    }
-};
-
-// Trampoline for IZoomRoomsServiceSink
-class ZoomRoomsServiceSinkTrampoline : public IZoomRoomsServiceSink {
-private:
-    py::object py_sink;
-
-public:
-    ZoomRoomsServiceSinkTrampoline(py::object obj) : py_sink(obj) {}
-
-    void OnPairRoomResult(int32_t result) override {
-        // Acquire GIL before calling Python
-        py::gil_scoped_acquire acquire;
-        if (py::hasattr(py_sink, "OnPairRoomResult")) {
-            py_sink.attr("OnPairRoomResult")(result);
-        }
-    }
-
-    void OnRoomUnpairedReason(RoomUnpairedReason reason) override {
-        py::gil_scoped_acquire acquire;
-        if (py::hasattr(py_sink, "OnRoomUnpairedReason")) {
-            py_sink.attr("OnRoomUnpairedReason")(reason);
-        }
-    }
-};
-
-// Trampoline for IPreMeetingServiceSink
-class PreMeetingServiceSinkTrampoline : public IPreMeetingServiceSink {
-private:
-    py::object py_sink;
-
-public:
-    PreMeetingServiceSinkTrampoline(py::object obj) : py_sink(obj) {}
-
-    void OnZRConnectionStateChanged(ConnectionState connectionState) override {
-        py::gil_scoped_acquire acquire;
-        if (py::hasattr(py_sink, "OnZRConnectionStateChanged")) {
-            py_sink.attr("OnZRConnectionStateChanged")(connectionState);
-        }
-    }
-
-    void OnShutdownOSNot(bool restartOS) override {
-        py::gil_scoped_acquire acquire;
-        if (py::hasattr(py_sink, "OnShutdownOSNot")) {
-            py_sink.attr("OnShutdownOSNot")(restartOS);
-        }
-    }
-};
+namespace nb = nanobind;
+using namespace ZRCSDK;
 
-PYBIND11_MODULE(zrc_sdk, m) {
+NB_MODULE(zrc_sdk, m) {
     m.doc() = "Zoom Rooms Controller SDK Python Bindings";
 
     // ===== Structs =====
-    py::class_<ZoomRoomInfo>(m, "ZoomRoomInfo")
-        .def(py::init<>())
-        .def_readwrite("roomName", &ZoomRoomInfo::roomName)
-        .def_readwrite("displayName", &ZoomRoomInfo::displayName)
-        .def_readwrite("roomAddress", &ZoomRoomInfo::roomAddress)
-        .def_readwrite("roomID", &ZoomRoomInfo::roomID)
-        .def_readwrite("worker", &ZoomRoomInfo::worker)
-        .def_readwrite("canRetryToPair", &ZoomRoomInfo::canRetryToPair);
+    nb::class_<ZoomRoomInfo>(m, "ZoomRoomInfo")
+        .def(nb::init<>())
+        .def_rw("roomName", &ZoomRoomInfo::roomName)
+        .def_rw("displayName", &ZoomRoomInfo::displayName)
+        .def_rw("roomAddress", &ZoomRoomInfo::roomAddress)
+        .def_rw("roomID", &ZoomRoomInfo::roomID)
+        .def_rw("worker", &ZoomRoomInfo::worker)
+        .def_rw("canRetryToPair", &ZoomRoomInfo::canRetryToPair);
 
     // ===== Enums =====
-    py::enum_<ZRCSDKError>(m, "ZRCSDKError")
+    nb::enum_<ZRCSDKError>(m, "ZRCSDKError", nb::is_arithmetic())
         .value("ZRCSDKERR_SUCCESS", ZRCSDKError::ZRCSDKERR_SUCCESS)
         .value("ZRCSDKERR_INTERNAL_ERROR", ZRCSDKError::ZRCSDKERR_INTERNAL_ERROR)
         .export_values();
 
-    py::enum_<MeetingStatus>(m, "MeetingStatus")
+    nb::enum_<MeetingStatus>(m, "MeetingStatus")
         .value("MeetingStatusNotInMeeting", MeetingStatus::MeetingStatusNotInMeeting)
         .value("MeetingStatusConnectingToMeeting", MeetingStatus::MeetingStatusConnectingToMeeting)
         .value("MeetingStatusInMeeting", MeetingStatus::MeetingStatusInMeeting)
         .value("MeetingStatusLoggedOut", MeetingStatus::MeetingStatusLoggedOut)
         .export_values();
 
-    py::enum_<ConnectionState>(m, "ConnectionState")
+    nb::enum_<ConnectionState>(m, "ConnectionState")
         .value("ConnectionStateNone", ConnectionState::ConnectionStateNone)
         .value("ConnectionStateEstablished", ConnectionState::ConnectionStateEstablished)
         .value("ConnectionStateConnected", ConnectionState::ConnectionStateConnected)
         .value("ConnectionStateDisconnected", ConnectionState::ConnectionStateDisconnected)
         .export_values();
 
-    py::enum_<ExitMeetingCmd>(m, "ExitMeetingCmd")
+    nb::enum_<ExitMeetingCmd>(m, "ExitMeetingCmd")
         .value("ExitMeetingCmdLeave", ExitMeetingCmd::ExitMeetingCmdLeave)
         .value("ExitMeetingCmdEnd", ExitMeetingCmd::ExitMeetingCmdEnd)
         .export_values();
 
-    py::enum_<RoomUnpairedReason>(m, "RoomUnpairedReason")
+    nb::enum_<RoomUnpairedReason>(m, "RoomUnpairedReason")
         .value("RoomUnpairedReason_TokenInvalid", RoomUnpairedReason::RoomUnpairedReason_TokenInvalid)
         .value("RoomUnpairedReason_RefreshTokenFail", RoomUnpairedReason::RoomUnpairedReason_RefreshTokenFail)
         .export_values();
 
     // ===== Core SDK =====
-    py::class_<IZRCSDK>(m, "IZRCSDK")
-        .def_static("GetInstance", &IZRCSDK::GetInstance, py::return_value_policy::reference)
-        .def_static("DestroyInstance", &IZRCSDK::DestroyInstance)
-        .def("HeartBeat", &IZRCSDK::HeartBeat)
-        .def("ForceFlushLog", &IZRCSDK::ForceFlushLog)
+    // Every SDK call drops the GIL and takes the SDK lock (zrc_service::sdk_call
+    // or an sdk_call_lock scope), so it can't overlap a HeartBeat tick and
+    // doesn't stall Python threads while it runs
+    nb::class_<IZRCSDK>(m, "IZRCSDK")
+        .def_static("GetInstance", &IZRCSDK::GetInstance, nb::rv_policy::reference, zrc_service::sdk_call())
+        .def_static("DestroyInstance", &IZRCSDK::DestroyInstance, zrc_service::sdk_call())
+        .def("HeartBeat", &IZRCSDK::HeartBeat, zrc_service::sdk_call())
+        .def("ForceFlushLog", &IZRCSDK::ForceFlushLog, zrc_service::sdk_call())
         .def("CreateZoomRoomsService", &IZRCSDK::CreateZoomRoomsService,
-             py::arg("roomID") = ZRCSDK_DEFAULT_ROOM_ID,
-             py::return_value_policy::reference)
-        .def("QueryAllZoomRoomsServices", &IZRCSDK::QueryAllZoomRoomsServices);
+             nb::arg("roomID") = ZRCSDK_DEFAULT_ROOM_ID,
+             nb::rv_policy::reference, zrc_service::sdk_call())
+        .def("QueryAllZoomRoomsServices", &zrc_service::query_all_zoom_rooms_services);
 
-    // Helper to register SDK sink
-    m.def("RegisterSDKSink", [](IZRCSDK* sdk, py::object py_sink) {
-        static std::shared_ptr<SimpleSinkImpl> sink_impl;
-        sink_impl = std::make_shared<SimpleSinkImpl>(py_sink);
-        return sdk->RegisterSink(sink_impl.get());
-    }, py::arg("sdk"), py::arg("sink"));
+    // HeartBeat pump, RegisterSDKSink and GetConnectionStates
+    zrc_service::bind(m);
 
     // ===== ZoomRooms Service =====
-    py::class_<IZoomRoomsService>(m, "IZoomRoomsService")
-        .def("PairRoomWithActivationCode", &IZoomRoomsService::PairRoomWithActivationCode)
-        .def("UnpairRoom", &IZoomRoomsService::UnpairRoom)
-        .def("RetryToPairRoom", &IZoomRoomsService::RetryToPairRoom)
-        .def("GetPreMeetingService", &IZoomRoomsService::GetPreMeetingService, py::return_value_policy::reference)
-        .def("GetMeetingService", &IZoomRoomsService::GetMeetingService, py::return_value_policy::reference)
-        .def("RegisterSink", [](IZoomRoomsService* self, py::object py_sink) {
-            // Create a trampoline and keep it alive in a static map
-            static std::map<IZoomRoomsService*, std::shared_ptr<ZoomRoomsServiceSinkTrampoline>> sinks;
-            auto trampoline = std::make_shared<ZoomRoomsServiceSinkTrampoline>(py_sink);
-            sinks[self] = trampoline;
-            return self->RegisterSink(trampoline.get());
-        })
-        .def("DeregisterSink", [](IZoomRoomsService* self) {
-            static std::map<IZoomRoomsService*, std::shared_ptr<ZoomRoomsServiceSinkTrampoline>> sinks;
-            auto it = sinks.find(self);
-            if (it != sinks.end()) {
-                auto result = self->DeregisterSink(it->second.get());
-                sinks.erase(it);
-                return result;
-            }
-            return ZRCSDKERR_INTERNAL_ERROR;
-        });
+    nb::class_<IZoomRoomsService>(m, "IZoomRoomsService")
+        .def("PairRoomWithActivationCode", &IZoomRoomsService::PairRoomWithActivationCode, zrc_service::sdk_call())
+        .def("UnpairRoom", &IZoomRoomsService::UnpairRoom, zrc_service::sdk_call())
+        .def("RetryToPairRoom", &IZoomRoomsService::RetryToPairRoom, zrc_service::sdk_call())
+        .def("GetPreMeetingService", &IZoomRoomsService::GetPreMeetingService, nb::rv_policy::reference,
+             zrc_service::sdk_call())
+        .def("GetMeetingService", &IZoomRoomsService::GetMeetingService, nb::rv_policy::reference,
+             zrc_service::sdk_call())
+        .def("RegisterSink", &zrc_service::register_room_service_sink)
+        .def("DeregisterSink", &zrc_service::deregister_room_service_sink);
 
     // ===== Pre-Meeting Service =====
-    py::class_<IPreMeetingService>(m, "IPreMeetingService")
-        .def("GetConnectionState", [](IPreMeetingService* self) {
-            ConnectionState state;
-            ZRCSDKError result = self->GetConnectionState(state);
-            return py::make_tuple(result, state);
-        })
-        .def("RegisterSink", [](IPreMeetingService* self, py::object py_sink) {
-            // Create a trampoline and keep it alive in a static map
-            static std::map<IPreMeetingService*, std::shared_ptr<PreMeetingServiceSinkTrampoline>> sinks;
-            auto trampoline = std::make_shared<PreMeetingServiceSinkTrampoline>(py_sink);
-            sinks[self] = trampoline;
-            return self->RegisterSink(trampoline.get());
-        })
-        .def("DeregisterSink", [](IPreMeetingService* self) {
-            static std::map<IPreMeetingService*, std::shared_ptr<PreMeetingServiceSinkTrampoline>> sinks;
-            auto it = sinks.find(self);
-            if (it != sinks.end()) {
-                auto result = self->DeregisterSink(it->second.get());
-                sinks.erase(it);
-                return result;
-            }
-            return ZRCSDKERR_INTERNAL_ERROR;
-        });
+    nb::class_<IPreMeetingService>(m, "IPreMeetingService")
+        .def("GetConnectionState", &zrc_service::get_connection_state)
+        .def("RegisterSink", &zrc_service::register_premeeting_sink)
+        .def("DeregisterSink", &zrc_service::deregister_premeeting_sink);
 
     // ===== Meeting Service =====
-    py::class_<IMeetingService>(m, "IMeetingService")
-        .def("StartInstantMeeting", &IMeetingService::StartInstantMeeting)
-        .def("JoinMeeting", &IMeetingService::JoinMeeting)
-        .def("ExitMeeting", &IMeetingService::ExitMeeting);
+    nb::class_<IMeetingService>(m, "IMeetingService")
+        .def("StartInstantMeeting", &IMeetingService::StartInstantMeeting, zrc_service::sdk_call())
+        .def("JoinMeeting", &IMeetingService::JoinMeeting, zrc_service::sdk_call())
+        .def("ExitMeeting", &IMeetingService::ExitMeeting, zrc_service::sdk_call())
+        .def("RegisterSink", &zrc_service::register_meeting_sink)
+        .def("DeregisterSink", &zrc_service::deregister_meeting_sink);
 }
@@ -0,0 +1,485 @@
+// Service-side additions to the zrc_sdk module; see zrc_service.h
+
+#include "zrc_service.h"
+
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <map>
+#include <memory>
+#include <optional>
+#include <thread>
+#include <utility>
+#include <vector>
+
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
+
+namespace nb = nanobind;
+using namespace ZRCSDK;
+
+namespace zrc_service {
+
+std::recursive_mutex& sdk_mutex() {
+    static std::recursive_mutex mutex;
+    return mutex;
+}
+
+namespace {
+
+// HeartBeat pump: a C++ thread that calls IZRCSDK::HeartBeat on absolute
+// deadlines, so the cadence doesn't depend on the Python event loop. Ticks
+// take the SDK lock, not the GIL: the GIL is only taken by the sink
+// callbacks a tick fires.
+class HeartBeatThread {
+private:
+    std::thread worker;
+    std::mutex mutex;
+    std::condition_variable wakeup;
+    bool running = false;
+    int interval_ms = 150;
+    std::chrono::steady_clock::time_point next_tick;
+
+    void Run(IZRCSDK* sdk) {
+        std::unique_lock<std::mutex> lock(mutex);
+        next_tick = std::chrono::steady_clock::now();
+        while (running) {
+            lock.unlock();
+            {
+                std::lock_guard<std::recursive_mutex> sdk_lock(sdk_mutex());
+                sdk->HeartBeat();
+            }
+            lock.lock();
+            next_tick += std::chrono::milliseconds(interval_ms);
+            // After a stall, resume the cadence rather than bursting to catch up
+            next_tick = std::max(next_tick, std::chrono::steady_clock::now());
+            // Re-read next_tick after every wakeup: SetInterval may move it in
+            while (running && std::chrono::steady_clock::now() < next_tick) {
+                wakeup.wait_until(lock, next_tick);
+            }
+        }
+    }
+
+public:
+    void Start(IZRCSDK* sdk, int interval) {
+        Stop();
+        std::lock_guard<std::mutex> lock(mutex);
+        interval_ms = interval;
+        running = true;
+        worker = std::thread(&HeartBeatThread::Run, this, sdk);
+    }
+
+    // Applies at once: a pump still waiting out a longer interval is woken
+    // and ticks no later than `interval` from now
+    void SetInterval(int interval) {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            interval_ms = interval;
+            next_tick = std::min(next_tick, std::chrono::steady_clock::now() +
+                                            std::chrono::milliseconds(interval));
+        }
+        wakeup.notify_one();
+    }
+
+    // Must be called without the GIL: a tick may be in a callback waiting for it
+    void Stop() {
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            running = false;
+        }
+        wakeup.notify_all();
+        if (worker.joinable()) {
+            worker.join();
+        }
+    }
+};
+
+HeartBeatThread heartbeat_thread;
+
+// Runs at interpreter exit: no tick may call into Python after finalization
+void stop_heartbeat() {
+    nb::gil_scoped_release release;
+    heartbeat_thread.Stop();
+}
+
+// Simple concrete implementation of IZRCSDKSink for use from C++
+// Python will not subclass this - we create it in C++
+// Each callback takes the GIL, since every SDK call runs with it released
+class SimpleSinkImpl : public IZRCSDKSink {
+private:
+    nb::object py_sink;
+
+public:
+    SimpleSinkImpl(nb::object obj) : py_sink(obj) {}
+
+    // Drop the Python reference; callbacks fall back to the defaults below
+    void Release() {
+        py_sink = nb::none();
+    }
+
+    std::string OnGetDeviceManufacturer() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetDeviceManufacturer")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetDeviceManufacturer")());
+        }
+        return "ZRC_Wrapper";
+    }
+
+    std::string OnGetDeviceModel() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetDeviceModel")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetDeviceModel")());
+        }
+        return "v1.0";
+    }
+
+    std::string OnGetDeviceSerialNumber() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetDeviceSerialNumber")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetDeviceSerialNumber")());
+        }
+        return "0000";
+    }
+
+    std::string OnGetDeviceMacAddress() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetDeviceMacAddress")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetDeviceMacAddress")());
+        }
+        return "00:00:00:00:00:00";
+    }
+
+    std::string OnGetDeviceIP() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetDeviceIP")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetDeviceIP")());
+        }
+        return "0.0.0.0";
+    }
+
+    std::string OnGetFirmwareVersion() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetFirmwareVersion")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetFirmwareVersion")());
+        }
+        return "1.0.0";
+    }
+
+    std::string OnGetAppName() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetAppName")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetAppName")());
+        }
+        return "ZRC_Wrapper";
+    }
+
+    std::string OnGetAppVersion() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetAppVersion")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetAppVersion")());
+        }
+        return "1.0.0";
+    }
+
+    std::string OnGetAppDeveloper() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetAppDeveloper")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetAppDeveloper")());
+        }
+        return "Custom";
+    }
+
+    std::string OnGetAppContact() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetAppContact")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetAppContact")());
+        }
+        return "support@example.com";
+    }
+
+    std::string OnGetAppContentDirPath() override {
+        nb::gil_scoped_acquire acquire;
+        if (nb::hasattr(py_sink, "OnGetAppContentDirPath")) {
+            return nb::cast<std::string>(py_sink.attr("OnGetAppContentDirPath")());
+        }
+        // Fallback: use /root/.zoom/data (contains third_zrc_data.db with room credentials)
+        return "/root/.zoom/data";
+    }
+
+    bool OnPromptToInputUserNamePasswordForProxyServer(const std::string& proxyHost, uint32_t port, const std::string& description) override {
+        return false;  // Don't prompt for proxy
+    }
+};
+
+// Resolve a sink callback once, when the sink is registered; None if the
+// Python object doesn't implement it
+nb::object sink_method(nb::handle py_sink, const char* name) {
+    return nb::getattr(py_sink, name, nb::none());
+}
+
+// Trampoline for IZoomRoomsServiceSink
+class ZoomRoomsServiceSinkTrampoline : public IZoomRoomsServiceSink {
+private:
+    nb::object on_pair_room_result;
+    nb::object on_room_unpaired_reason;
+
+public:
+    ZoomRoomsServiceSinkTrampoline(nb::object obj)
+        : on_pair_room_result(sink_method(obj, "OnPairRoomResult")),
+          on_room_unpaired_reason(sink_method(obj, "OnRoomUnpairedReason")) {}
+
+    void Release() {
+        on_pair_room_result = nb::none();
+        on_room_unpaired_reason = nb::none();
+    }
+
+    void OnPairRoomResult(int32_t result) override {
+        // Acquire GIL before calling Python
+        nb::gil_scoped_acquire acquire;
+        if (!on_pair_room_result.is_none()) {
+            on_pair_room_result(result);
+        }
+    }
+
+    void OnRoomUnpairedReason(RoomUnpairedReason reason) override {
+        nb::gil_scoped_acquire acquire;
+        if (!on_room_unpaired_reason.is_none()) {
+            on_room_unpaired_reason(reason);
+        }
+    }
+};
+
+// Trampoline for IPreMeetingServiceSink
+class PreMeetingServiceSinkTrampoline : public IPreMeetingServiceSink {
+private:
+    nb::object on_connection_state_changed;
+    nb::object on_shutdown_os_not;
+
+public:
+    PreMeetingServiceSinkTrampoline(nb::object obj)
+        : on_connection_state_changed(sink_method(obj, "OnZRConnectionStateChanged")),
+          on_shutdown_os_not(sink_method(obj, "OnShutdownOSNot")) {}
+
+    void Release() {
+        on_connection_state_changed = nb::none();
+        on_shutdown_os_not = nb::none();
+    }
+
+    void OnZRConnectionStateChanged(ConnectionState connectionState) override {
+        nb::gil_scoped_acquire acquire;
+        if (!on_connection_state_changed.is_none()) {
+            on_connection_state_changed(connectionState);
+        }
+    }
+
+    void OnShutdownOSNot(bool restartOS) override {
+        nb::gil_scoped_acquire acquire;
+        if (!on_shutdown_os_not.is_none()) {
+            on_shutdown_os_not(restartOS);
+        }
+    }
+};
+
+// Trampoline for IMeetingServiceSink
+class MeetingServiceSinkTrampoline : public IMeetingServiceSink {
+private:
+    nb::object on_update_meeting_status;
+    nb::object on_conf_ready_notification;
+    nb::object on_exit_meeting_notification;
+
+public:
+    MeetingServiceSinkTrampoline(nb::object obj)
+        : on_update_meeting_status(sink_method(obj, "OnUpdateMeetingStatus")),
+          on_conf_ready_notification(sink_method(obj, "OnConfReadyNotification")),
+          on_exit_meeting_notification(sink_method(obj, "OnExitMeetingNotification")) {}
+
+    void Release() {
+        on_update_meeting_status = nb::none();
+        on_conf_ready_notification = nb::none();
+        on_exit_meeting_notification = nb::none();
+    }
+
+    void OnUpdateMeetingStatus(MeetingStatus status) override {
+        nb::gil_scoped_acquire acquire;
+        if (!on_update_meeting_status.is_none()) {
+            on_update_meeting_status(status);
+        }
+    }
+
+    void OnConfReadyNotification() override {
+        nb::gil_scoped_acquire acquire;
+        if (!on_conf_ready_notification.is_none()) {
+            on_conf_ready_notification();
+        }
+    }
+
+    void OnExitMeetingNotification() override {
+        nb::gil_scoped_acquire acquire;
+        if (!on_exit_meeting_notification.is_none()) {
+            on_exit_meeting_notification();
+        }
+    }
+};
+
+// Sinks handed to the SDK, which only keeps raw pointers: they live here for
+// as long as the SDK may call them. register_*/deregister_* share these.
+std::shared_ptr<SimpleSinkImpl> sdk_sink;
+std::map<IZoomRoomsService*, std::shared_ptr<ZoomRoomsServiceSinkTrampoline>> room_service_sinks;
+std::map<IPreMeetingService*, std::shared_ptr<PreMeetingServiceSinkTrampoline>> premeeting_sinks;
+std::map<IMeetingService*, std::shared_ptr<MeetingServiceSinkTrampoline>> meeting_sinks;
+
+// Runs at interpreter exit, while Python is still usable: drops every Python
+// reference the sinks hold. The sinks themselves outlive the interpreter, so
+// their destructors must not touch Python objects.
+void release_python_refs() {
+    if (sdk_sink) {
+        sdk_sink->Release();
+    }
+    for (auto& entry : room_service_sinks) {
+        entry.second->Release();
+    }
+    for (auto& entry : premeeting_sinks) {
+        entry.second->Release();
+    }
+    for (auto& entry : meeting_sinks) {
+        entry.second->Release();
+    }
+}
+
+// RegisterSink for a service: wraps the Python object in a Sink and keeps
+// it alive in `sinks` until the matching deregister_sink
+template <class Service, class Sink>
+ZRCSDKError register_sink(std::map<Service*, std::shared_ptr<Sink>>& sinks,
+                          Service* service, nb::object py_sink) {
+    auto sink = std::make_shared<Sink>(py_sink);
+    sinks[service] = sink;
+    sdk_call_lock guard;
+    return service->RegisterSink(sink.get());
+}
+
+template <class Service, class Sink>
+ZRCSDKError deregister_sink(std::map<Service*, std::shared_ptr<Sink>>& sinks, Service* service) {
+    auto it = sinks.find(service);
+    if (it == sinks.end()) {
+        return ZRCSDKERR_INTERNAL_ERROR;
+    }
+    ZRCSDKError result;
+    {
+        sdk_call_lock guard;
+        result = service->DeregisterSink(it->second.get());
+    }
+    // Destroying the sink drops Python references: GIL held again here
+    sinks.erase(it);
+    return result;
+}
+
+}  // namespace
+
+ZRCSDKError register_room_service_sink(IZoomRoomsService* service, nb::object sink) {
+    return register_sink(room_service_sinks, service, std::move(sink));
+}
+
+ZRCSDKError deregister_room_service_sink(IZoomRoomsService* service) {
+    return deregister_sink(room_service_sinks, service);
+}
+
+ZRCSDKError register_premeeting_sink(IPreMeetingService* service, nb::object sink) {
+    return register_sink(premeeting_sinks, service, std::move(sink));
+}
+
+ZRCSDKError deregister_premeeting_sink(IPreMeetingService* service) {
+    return deregister_sink(premeeting_sinks, service);
+}
+
+ZRCSDKError register_meeting_sink(IMeetingService* service, nb::object sink) {
+    return register_sink(meeting_sinks, service, std::move(sink));
+}
+
+ZRCSDKError deregister_meeting_sink(IMeetingService* service) {
+    return deregister_sink(meeting_sinks, service);
+}
+
+nb::tuple query_all_zoom_rooms_services(IZRCSDK* sdk) {
+    std::vector<ZoomRoomInfo> infos;
+    ZRCSDKError result;
+    {
+        sdk_call_lock guard;
+        result = sdk->QueryAllZoomRoomsServices(infos);
+    }
+    nb::list rooms;
+    for (const ZoomRoomInfo& info : infos) {
+        rooms.append(nb::make_tuple(info.roomID, info.roomName, info.displayName,
+                                    info.roomAddress, info.canRetryToPair,
+                                    nb::cast(info.worker, nb::rv_policy::reference)));
+    }
+    return nb::make_tuple(result, rooms);
+}
+
+nb::tuple get_connection_state(IPreMeetingService* service) {
+    ConnectionState state = ConnectionState::ConnectionStateNone;
+    ZRCSDKError result;
+    {
+        sdk_call_lock guard;
+        result = service->GetConnectionState(state);
+    }
+    return nb::make_tuple(result, state);
+}
+
+void bind(nb::module_& m) {
+    // SDK-level sink; any Python object, each callback is optional
+    m.def("RegisterSDKSink", [](IZRCSDK* sdk, nb::object py_sink) {
+        sdk_sink = std::make_shared<SimpleSinkImpl>(py_sink);
+        sdk_call_lock guard;
+        return sdk->RegisterSink(sdk_sink.get());
+    }, nb::arg("sdk"), nb::arg("sink"));
+
+    // HeartBeat pump (replaces calling sdk.HeartBeat() from a Python timer)
+    m.def("StartHeartBeatThread", [](IZRCSDK* sdk, int interval_ms) {
+        heartbeat_thread.Start(sdk, interval_ms);
+    }, nb::arg("sdk"), nb::arg("interval_ms") = 150, nb::call_guard<nb::gil_scoped_release>());
+    m.def("SetHeartBeatInterval", [](int interval_ms) {
+        heartbeat_thread.SetInterval(interval_ms);
+    }, nb::arg("interval_ms"));
+    m.def("StopHeartBeatThread", []() {
+        heartbeat_thread.Stop();
+    }, nb::call_guard<nb::gil_scoped_release>());
+
+    // Batch form of IPreMeetingService.GetConnectionState: one crossing for all
+    // rooms. Each room gets its own (result, state), or None if its service
+    // is missing or the call threw, so one bad room doesn't fail the rest.
+    m.def("GetConnectionStates", [](const std::vector<IPreMeetingService*>& services) {
+        std::vector<std::optional<std::pair<ZRCSDKError, ConnectionState>>> results(services.size());
+        {
+            sdk_call_lock guard;
+            for (size_t i = 0; i < services.size(); ++i) {
+                if (!services[i]) {
+                    continue;
+                }
+                try {
+                    ConnectionState state = ConnectionState::ConnectionStateNone;
+                    ZRCSDKError result = services[i]->GetConnectionState(state);
+                    results[i].emplace(result, state);
+                } catch (...) {
+                    // Left as None; the SDK's exception types aren't documented
+                }
+            }
+        }
+        nb::list states;
+        for (const auto& status : results) {
+            if (status) {
+                states.append(nb::make_tuple(status->first, status->second));
+            } else {
+                states.append(nb::none());
+            }
+        }
+        return states;
+    }, nb::arg("services"));
+
+    // atexit runs hooks in reverse: the pump stops before the sinks' Python
+    // references are released, and both before the interpreter goes away
+    nb::module_ atexit = nb::module_::import_("atexit");
+    atexit.attr("register")(nb::cpp_function(release_python_refs));
+    atexit.attr("register")(nb::cpp_function(stop_heartbeat));
+}
+
+}  // namespace zrc_service
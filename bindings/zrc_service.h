@@ -0,0 +1,60 @@
+// Service-side additions to the zrc_sdk module: the SDK call lock, the
+// HeartBeat pump, the sinks that forward SDK callbacks to plain Python
+// objects and the other wrappers the service calls that don't map onto a
+// plain method. Hand-written and never regenerated; compiled into the module
+// next to zrc_bindings.cpp or simple_generator.py's output, which both use it.
+
+#pragma once
+
+#include <mutex>
+
+#include <nanobind/nanobind.h>
+
+#include "IMeetingService.h"
+#include "IPreMeetingService.h"
+#include "IZRCSDK.h"
+#include "IZoomRoomsService.h"
+
+namespace zrc_service {
+
+// The SDK is not documented as thread-safe, so every call into it - bound
+// methods and HeartBeat ticks alike - runs under this one lock. It is
+// recursive because a callback fired from inside an SDK call may call back
+// into the SDK on the same thread.
+std::recursive_mutex& sdk_mutex();
+
+// Held around an SDK call: drops the GIL first, then takes the SDK lock, so
+// a thread waiting for the lock never stalls Python and the SDK's callbacks
+// can still take the GIL. Members are constructed in declaration order.
+struct sdk_call_lock {
+    nanobind::gil_scoped_release release;
+    std::lock_guard<std::recursive_mutex> lock{sdk_mutex()};
+};
+
+// call_guard for bound SDK entry points that only take C++ arguments
+using sdk_call = nanobind::call_guard<sdk_call_lock>;
+
+// IZRCSDK.QueryAllZoomRoomsServices: returns (result, [(roomID, roomName,
+// displayName, roomAddress, canRetryToPair, worker)]). A list argument would
+// be converted to a temporary vector and never see the rooms, and flattening
+// here spares Python a property read per field.
+nanobind::tuple query_all_zoom_rooms_services(ZRCSDK::IZRCSDK* sdk);
+
+// IPreMeetingService.GetConnectionState: returns (result, state)
+nanobind::tuple get_connection_state(ZRCSDK::IPreMeetingService* service);
+
+// RegisterSink / DeregisterSink taking any Python object: its On* methods
+// are looked up once, and the ones it lacks are skipped. The sink stays
+// alive until deregistered (or the interpreter exits).
+ZRCSDK::ZRCSDKError register_room_service_sink(ZRCSDK::IZoomRoomsService* service, nanobind::object sink);
+ZRCSDK::ZRCSDKError deregister_room_service_sink(ZRCSDK::IZoomRoomsService* service);
+ZRCSDK::ZRCSDKError register_premeeting_sink(ZRCSDK::IPreMeetingService* service, nanobind::object sink);
+ZRCSDK::ZRCSDKError deregister_premeeting_sink(ZRCSDK::IPreMeetingService* service);
+ZRCSDK::ZRCSDKError register_meeting_sink(ZRCSDK::IMeetingService* service, nanobind::object sink);
+ZRCSDK::ZRCSDKError deregister_meeting_sink(ZRCSDK::IMeetingService* service);
+
+// Module-level functions: RegisterSDKSink, StartHeartBeatThread,
+// SetHeartBeatInterval, StopHeartBeatThread and GetConnectionStates
+void bind(nanobind::module_& m);
+
+}  // namespace zrc_service
@@ -1,85 +1,205 @@
 #!/usr/bin/env python3
 """
 Example client demonstrating how to interact with the Zoom Rooms SDK microservice
+
+Requires aiohttp. Optional speedups: pip install orjson uvloop
 """
 
 import asyncio
 import aiohttp
 import json
+from typing import Dict
+
+# orjson decodes event frames several times faster than the stdlib; optional
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# uvloop gives a faster event loop for the HTTP + WebSocket traffic; optional
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Query-string encoding for booleans, indexed by the bool itself
+_BOOL_STR = ("false", "true")
 
 
 class ZoomRoomsClient:
     """Client for the Zoom Rooms SDK microservice"""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000",
+                 pool_limit: int = 16, keepalive: float = 120,
+                 ping_interval: float = 30):
         self.base_url = base_url
+        self.pool_limit = pool_limit
+        self.keepalive = keepalive
+        self.ping_interval = ping_interval
+        self._session: aiohttp.ClientSession = None
+        self._ping_task = None
+        # Latched per event name as events arrive; see wait_for_event()
+        self._events: Dict[str, asyncio.Event] = {}
+
+    async def __aenter__(self):
+        """Open a single pooled session shared by every call on this client"""
+        # aiohttp drops idle sockets after 15s by default; hold them open longer
+        # so bursty controller traffic lands on a warm connection
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_limit,
+            limit_per_host=self.pool_limit,
+            keepalive_timeout=self.keepalive,
+            ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(base_url=self.base_url, connector=connector)
+        if self.ping_interval:
+            self._ping_task = asyncio.create_task(self._keep_pool_warm())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._ping_task:
+            self._ping_task.cancel()
+            try:
+                await self._ping_task
+            except asyncio.CancelledError:
+                pass
+            self._ping_task = None
+        await self._session.close()
+        self._session = None
+
+    async def _keep_pool_warm(self):
+        """Periodically hit the service so pooled connections don't go idle"""
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            try:
+                async with self._session.get("/") as resp:
+                    await resp.read()
+            except aiohttp.ClientError:
+                pass
 
     async def pair_room(self, room_id: str, activation_code: str):
         """Pair a Zoom Room"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/rooms/{room_id}/pair",
-                json={"activation_code": activation_code}
-            ) as resp:
-                return await resp.json()
+        async with self._session.post(
+            f"/api/rooms/{room_id}/pair",
+            json={"activation_code": activation_code}
+        ) as resp:
+            return await resp.json()
 
     async def start_instant_meeting(self, room_id: str):
         """Start an instant meeting"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/rooms/{room_id}/meeting/start_instant"
-            ) as resp:
-                return await resp.json()
+        async with self._session.post(
+            f"/api/rooms/{room_id}/meeting/start_instant"
+        ) as resp:
+            return await resp.json()
 
     async def join_meeting(self, room_id: str, meeting_number: str, password: str = ""):
         """Join a meeting by number"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/rooms/{room_id}/meeting/join",
-                json={"meeting_number": meeting_number, "password": password}
-            ) as resp:
-                return await resp.json()
+        async with self._session.post(
+            f"/api/rooms/{room_id}/meeting/join",
+            json={"meeting_number": meeting_number, "password": password}
+        ) as resp:
+            return await resp.json()
 
     async def exit_meeting(self, room_id: str):
         """Exit the current meeting"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/rooms/{room_id}/meeting/exit"
-            ) as resp:
-                return await resp.json()
+        async with self._session.post(
+            f"/api/rooms/{room_id}/meeting/exit"
+        ) as resp:
+            return await resp.json()
 
     async def mute_audio(self, room_id: str, mute: bool = True):
         """Mute/unmute audio"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/rooms/{room_id}/audio/mute?mute={str(mute).lower()}"
-            ) as resp:
-                return await resp.json()
+        async with self._session.post(
+            f"/api/rooms/{room_id}/audio/mute",
+            params={"mute": _BOOL_STR[mute]}
+        ) as resp:
+            return await resp.json()
 
     async def mute_video(self, room_id: str, mute: bool = True):
         """Mute/unmute video"""
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.base_url}/api/rooms/{room_id}/video/mute?mute={str(mute).lower()}"
-            ) as resp:
-                return await resp.json()
-
-    async def listen_to_events(self, room_id: str, callback):
-        """Listen to real-time events via WebSocket"""
-        ws_url = f"ws://localhost:8000/api/rooms/{room_id}/events"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.ws_connect(ws_url) as ws:
+        async with self._session.post(
+            f"/api/rooms/{room_id}/video/mute",
+            params={"mute": _BOOL_STR[mute]}
+        ) as resp:
+            return await resp.json()
+
+    async def get_service_info(self):
+        """Get service info from the root endpoint"""
+        async with self._session.get("/") as resp:
+            return await resp.json()
+
+    async def listen_to_events(self, room_id: str, callback, max_queue: int = 1024):
+        """Listen to real-time events via WebSocket
+
+        Frames are decoded by the reader and handed to a separate consumer task
+        through a bounded queue, so a slow callback never stalls WebSocket reads.
+        When the queue is full the oldest pending event is dropped.
+        """
+        queue = asyncio.Queue(maxsize=max_queue)
+        consumer = asyncio.create_task(self._drain_events(queue, callback))
+
+        try:
+            # Binary frames carry the service's orjson bytes without a decode;
+            # batch mode folds event bursts into one {"events": [...]} frame
+            async with self._session.ws_connect(
+                f"/api/rooms/{room_id}/events", params={"binary": "true", "batch": "true"}
+            ) as ws:
                 print(f"Connected to events for room: {room_id}")
+                self._get_event("connected").set()
 
                 async for msg in ws:
-                    if msg.type == aiohttp.WSMsgType.TEXT:
-                        event = json.loads(msg.data)
-                        await callback(event)
+                    if msg.type == aiohttp.WSMsgType.TEXT or msg.type == aiohttp.WSMsgType.BINARY:
+                        # orjson parses bytes directly, so binary frames skip a str decode
+                        data = msg.json(loads=json_loads)
+                        # Batch frames carry {"events": [...]}, plain frames a single event
+                        for event in data.get("events", [data]):
+                            self._get_event(event.get("event")).set()
+                            if queue.full():
+                                queue.get_nowait()
+                            queue.put_nowait(event)
                     elif msg.type == aiohttp.WSMsgType.ERROR:
                         print(f"WebSocket error: {ws.exception()}")
                         break
 
+            # Let the consumer finish what's queued, then stop on the sentinel
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+            await consumer
+        finally:
+            if not consumer.done():
+                consumer.cancel()
+
+    def _get_event(self, name: str) -> asyncio.Event:
+        event = self._events.get(name)
+        if event is None:
+            event = self._events[name] = asyncio.Event()
+        return event
+
+    async def wait_for_event(self, name: str, timeout: float = None) -> bool:
+        """Wait until an event named `name` has been received
+
+        Returns immediately if one arrived since the last wait for that name
+        (the event is consumed), and False if `timeout` expires first. The
+        name "connected" fires once the events WebSocket is open.
+        """
+        event = self._get_event(name)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        event.clear()
+        return True
+
+    @staticmethod
+    async def _drain_events(queue: asyncio.Queue, callback):
+        """Deliver queued events to the callback until the None sentinel"""
+        while True:
+            event = await queue.get()
+            if event is None:
+                break
+            await callback(event)
+
 
 async def example_event_handler(event: dict):
     """Example callback for handling events"""
@@ -113,80 +233,85 @@ async def example_event_handler(event: dict):
 async def example_usage():
     """Example demonstrating typical usage patterns"""
 
-    client = ZoomRoomsClient()
     room_id = "conference_room_1"
 
     print("=" * 60)
     print("Zoom Rooms SDK Microservice - Example Client")
     print("=" * 60)
 
-    # Start listening to events in the background
-    event_task = asyncio.create_task(
-        client.listen_to_events(room_id, example_event_handler)
-    )
-
-    # Give the WebSocket connection time to establish
-    await asyncio.sleep(1)
-
-    try:
-        # Example 1: Pair a room (replace with your actual activation code)
-        print("\n[1] Pairing room...")
-        print("NOTE: Replace 'YOUR-ACTIVATION-CODE' with actual code")
-        # result = await client.pair_room(room_id, "123-456-789")
-        # print(f"Pair result: {result}")
-
-        # Wait for pairing to complete
-        await asyncio.sleep(2)
-
-        # Example 2: Start an instant meeting
-        print("\n[2] Starting instant meeting...")
-        result = await client.start_instant_meeting(room_id)
-        print(f"Start meeting result: {result}")
+    async with ZoomRoomsClient() as client:
+        # Start listening to events in the background
+        event_task = asyncio.create_task(
+            client.listen_to_events(room_id, example_event_handler)
+        )
 
-        # Wait for meeting to connect
-        await asyncio.sleep(5)
+        # Wait for the WebSocket connection to be established
+        await client.wait_for_event("connected", timeout=5)
 
-        # Example 3: Mute/unmute audio
-        print("\n[3] Muting audio...")
-        result = await client.mute_audio(room_id, mute=True)
-        print(f"Mute result: {result}")
-
-        await asyncio.sleep(2)
-
-        print("\n[4] Unmuting audio...")
-        result = await client.mute_audio(room_id, mute=False)
-        print(f"Unmute result: {result}")
-
-        # Example 4: Mute video
-        print("\n[5] Muting video...")
-        result = await client.mute_video(room_id, mute=True)
-        print(f"Mute video result: {result}")
-
-        # Wait a bit
-        await asyncio.sleep(5)
-
-        # Example 5: Exit meeting
-        print("\n[6] Exiting meeting...")
-        result = await client.exit_meeting(room_id)
-        print(f"Exit result: {result}")
-
-        # Keep listening to events for a bit longer
-        print("\n[7] Listening to events for 5 more seconds...")
-        await asyncio.sleep(5)
-
-    except KeyboardInterrupt:
-        print("\nInterrupted by user")
-
-    except Exception as e:
-        print(f"\nError: {e}")
-
-    finally:
-        # Cancel event listening
-        event_task.cancel()
         try:
-            await event_task
-        except asyncio.CancelledError:
-            pass
+            # Example 1: Pair a room (replace with your actual activation code)
+            print("\n[1] Pairing room...")
+            print("NOTE: Replace 'YOUR-ACTIVATION-CODE' with actual code")
+            # The pair endpoint returns once the room is paired and connected
+            # result = await client.pair_room(room_id, "123-456-789")
+            # print(f"Pair result: {result}")
+
+            # Example 2: Start an instant meeting
+            print("\n[2] Starting instant meeting...")
+            result = await client.start_instant_meeting(room_id)
+            print(f"Start meeting result: {result}")
+
+            # The room's meeting sink reports when the meeting is up; only
+            # wait if the command was accepted
+            if result.get("success") and not await client.wait_for_event(
+                "OnConfReadyNotification", timeout=10
+            ):
+                print("Timed out waiting for conference to be ready")
+
+            # Example 3: Mute audio and video (independent calls, run concurrently)
+            print("\n[3] Muting audio and video...")
+            audio_result, video_result = await asyncio.gather(
+                client.mute_audio(room_id, mute=True),
+                client.mute_video(room_id, mute=True),
+                return_exceptions=True
+            )
+            print(f"Mute audio result: {audio_result}")
+            print(f"Mute video result: {video_result}")
+
+            # Example 4: Unmute audio and video
+            print("\n[4] Unmuting audio and video...")
+            audio_result, video_result = await asyncio.gather(
+                client.mute_audio(room_id, mute=False),
+                client.mute_video(room_id, mute=False),
+                return_exceptions=True
+            )
+            print(f"Unmute audio result: {audio_result}")
+            print(f"Unmute video result: {video_result}")
+
+            # Example 5: Exit meeting
+            print("\n[5] Exiting meeting...")
+            result = await client.exit_meeting(room_id)
+            print(f"Exit result: {result}")
+
+            # Keep listening until the exit is confirmed
+            if result.get("success"):
+                print("\n[6] Waiting for exit notification...")
+                if not await client.wait_for_event("OnExitMeetingNotification", timeout=5):
+                    print("Timed out waiting for exit notification")
+
+        except KeyboardInterrupt:
+            print("\nInterrupted by user")
+
+        except Exception as e:
+            print(f"\nError: {e}")
+
+        finally:
+            # Cancel event listening
+            event_task.cancel()
+            try:
+                await event_task
+            except asyncio.CancelledError:
+                pass
 
     print("\n" + "=" * 60)
     print("Example complete!")
@@ -196,21 +321,35 @@ async def example_usage():
 async def simple_example():
     """Simpler example showing just the REST API"""
 
-    client = ZoomRoomsClient()
     room_id = "test_room"
 
-    # Check service is running
-    async with aiohttp.ClientSession() as session:
-        async with session.get("http://localhost:8000/") as resp:
-            print(await resp.json())
+    async with ZoomRoomsClient() as client:
+        # Check service is running
+        print(await client.get_service_info())
+
+        # Start a meeting
+        result = await client.start_instant_meeting(room_id)
+        print(f"Started meeting: {result}")
+
+        # Mute audio
+        result = await client.mute_audio(room_id, True)
+        print(f"Muted audio: {result}")
 
-    # Start a meeting
-    result = await client.start_instant_meeting(room_id)
-    print(f"Started meeting: {result}")
 
-    # Mute audio
-    result = await client.mute_audio(room_id, True)
-    print(f"Muted audio: {result}")
+def run(coro):
+    """Run a coroutine on uvloop if installed, otherwise the default loop"""
+    if not hasattr(asyncio, "Runner"):
+        # Python < 3.11: no Runner (and no eager tasks either)
+        if uvloop:
+            return uvloop.run(coro)
+        return asyncio.run(coro)
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory, debug=False) as runner:
+        # Python 3.12+: start new tasks eagerly, skipping a scheduler round-trip
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+        if eager_task_factory:
+            runner.get_loop().set_task_factory(eager_task_factory)
+        return runner.run(coro)
 
 
 if __name__ == "__main__":
@@ -221,6 +360,6 @@ if __name__ == "__main__":
     choice = input("Enter 1 or 2 [1]: ").strip() or "1"
 
     if choice == "2":
-        asyncio.run(simple_example())
+        run(simple_example())
     else:
-        asyncio.run(example_usage())
+        run(example_usage())
@@ -2,76 +2,202 @@
 """
 Zoom Rooms SDK Binding Generator
 
-Parses C++ SDK headers and generates pybind11 bindings automatically.
+Parses C++ SDK headers and generates nanobind bindings automatically.
 This allows easy updates when new SDK versions are released.
 """
 
+import hashlib
 import os
+import pickle
+import re
 import sys
 from pathlib import Path
-from typing import List, Dict, Set, Optional
-from dataclasses import dataclass, field
-from jinja2 import Template
+from typing import List, Dict, Set, Optional, Tuple
 
 try:
-    from clang.cindex import Index, CursorKind, TypeKind, AccessSpecifier
+    from clang.cindex import Index, CursorKind, TypeKind, AccessSpecifier, TranslationUnit
 except ImportError:
     print("ERROR: libclang not found. Install with: pip install libclang")
     sys.exit(1)
 
 
-@dataclass
+# Plain classes with hand-written __slots__ rather than @dataclass(slots=True),
+# which needs Python 3.10: the parser creates thousands of these
+
 class MethodInfo:
     """Represents a method/function to bind"""
-    name: str
-    return_type: str
-    params: List[tuple]  # [(name, type), ...]
-    is_static: bool = False
-    is_const: bool = False
-    is_virtual: bool = False
-    is_pure_virtual: bool = False
+
+    __slots__ = ('name', 'return_type', 'params', 'is_static', 'is_const', 'is_virtual',
+                 'is_pure_virtual', 'param_decls', 'param_names', 'arg_specs', 'release_gil')
+
+    def __init__(self, name: str, return_type: str, params: List[tuple],  # [(name, type), ...]
+                 is_static: bool = False, is_const: bool = False, is_virtual: bool = False,
+                 is_pure_virtual: bool = False,
+                 # Pre-formatted for trampoline generation
+                 param_decls: str = '', param_names: Optional[List[str]] = None,
+                 # Extra .def() arguments: ', nb::arg("x")...' and GIL release
+                 arg_specs: str = '', release_gil: bool = False):
+        self.name = name
+        self.return_type = return_type
+        self.params = params
+        self.is_static = is_static
+        self.is_const = is_const
+        self.is_virtual = is_virtual
+        self.is_pure_virtual = is_pure_virtual
+        self.param_decls = param_decls
+        self.param_names = [] if param_names is None else param_names
+        self.arg_specs = arg_specs
+        self.release_gil = release_gil
 
 
-@dataclass
 class ClassInfo:
     """Represents a class/interface to bind"""
-    name: str
-    full_name: str
-    is_interface: bool = False
-    methods: List[MethodInfo] = field(default_factory=list)
-    parent_classes: List[str] = field(default_factory=list)
-    is_sink: bool = False  # Callback interface
+
+    __slots__ = ('name', 'full_name', 'is_interface', 'methods', 'parent_classes', 'is_sink')
+
+    def __init__(self, name: str, full_name: str, is_interface: bool = False,
+                 methods: Optional[List[MethodInfo]] = None,
+                 parent_classes: Optional[List[str]] = None,
+                 is_sink: bool = False):  # Callback interface
+        self.name = name
+        self.full_name = full_name
+        self.is_interface = is_interface
+        self.methods = [] if methods is None else methods
+        self.parent_classes = [] if parent_classes is None else parent_classes
+        self.is_sink = is_sink
 
 
-@dataclass
 class EnumInfo:
     """Represents an enum to bind"""
-    name: str
-    values: List[tuple]  # [(name, value), ...]
+
+    __slots__ = ('name', 'values')
+
+    def __init__(self, name: str, values: List[tuple]):  # [(name, value), ...]
+        self.name = name
+        self.values = values
+
+
+_CLASS_DECL = CursorKind.CLASS_DECL
+_STRUCT_DECL = CursorKind.STRUCT_DECL
+_ENUM_DECL = CursorKind.ENUM_DECL
+_CXX_BASE_SPECIFIER = CursorKind.CXX_BASE_SPECIFIER
+_CXX_METHOD = CursorKind.CXX_METHOD
+_ENUM_CONSTANT_DECL = CursorKind.ENUM_CONSTANT_DECL
+
+# Only classes whose names start with one of these are bound; anything else
+# in the SDK headers is an internal helper type
+ACCEPT_PREFIXES = ('I', 'Z', 'SDK')
+
+_is_sink_name = re.compile(r'Sink|Callback').search
+
+# Long-running SDK calls bound with the GIL released; sink callbacks they
+# trigger reacquire it in the trampolines
+GIL_RELEASE_METHODS = frozenset({'HeartBeat', 'QueryAllZoomRoomsServices'})
+
+# Enums bound with nb::is_arithmetic() so Python can int() / compare them;
+# the rest stay plain so str() keeps reading "ConnectionState.X"
+ARITHMETIC_ENUMS = frozenset({'ZRCSDKError'})
+
+# Parameter types bound with .noconvert(), so e.g. a float is rejected
+# rather than silently truncated
+_NOCONVERT_KINDS = frozenset({
+    TypeKind.BOOL,
+    TypeKind.CHAR_S, TypeKind.SCHAR, TypeKind.UCHAR,
+    TypeKind.SHORT, TypeKind.USHORT,
+    TypeKind.INT, TypeKind.UINT,
+    TypeKind.LONG, TypeKind.ULONG,
+    TypeKind.LONGLONG, TypeKind.ULONGLONG,
+    TypeKind.ENUM,
+})
+
+# Cursor kinds that can contain class/enum declarations; everything else
+# (functions, methods, fields, ...) is a leaf for our purposes
+_CONTAINER_KINDS = frozenset({
+    CursorKind.TRANSLATION_UNIT,
+    CursorKind.NAMESPACE,
+    CursorKind.LINKAGE_SPEC,
+    CursorKind.UNEXPOSED_DECL,
+    _CLASS_DECL,
+    _STRUCT_DECL,
+})
+
+
+# Parse-cache key component: cached ClassInfo/MethodInfo only fit the parser
+# (and GIL_RELEASE_METHODS, _NOCONVERT_KINDS, ...) that produced them
+_SOURCE_HASH = hashlib.sha1(Path(__file__).read_bytes()).hexdigest()
 
 
 class SDKParser:
     """Parse SDK headers with libclang"""
 
-    def __init__(self, sdk_include_path: str):
+    # Parsed (classes, enums) per header, reused while the header is unchanged
+    CACHE_DIR = Path.home() / '.cache' / 'zrc_bindgen'
+
+    def __init__(self, sdk_include_path: str, accept_prefixes: Tuple[str, ...] = ACCEPT_PREFIXES,
+                 use_cache: bool = True):
         self.sdk_include_path = Path(sdk_include_path)
+        self.accept_prefixes = tuple(accept_prefixes)
+        self.use_cache = use_cache
+        self._clang_args = (
+            '-x', 'c++',
+            '-std=c++11',
+            f'-I{self.sdk_include_path}',
+            f'-I{self.sdk_include_path}/include',
+            f'-I{self.sdk_include_path}/include/ServiceComponents',
+        )
         self.index = Index.create()
         self.classes: Dict[str, ClassInfo] = {}
         self.enums: Dict[str, EnumInfo] = {}
 
     def parse_header(self, header_path: Path, clang_args: List[str] = None):
         """Parse a single header file"""
-        if clang_args is None:
-            clang_args = [
-                '-x', 'c++',
-                '-std=c++11',
-                f'-I{self.sdk_include_path}',
-                f'-I{self.sdk_include_path}/include',
-                f'-I{self.sdk_include_path}/include/ServiceComponents',
-            ]
+        header_str = str(header_path)
+        classes, enums = self._parse_tu(header_str, [header_str], clang_args)
+        self.classes.update(classes)
+        self.enums.update(enums)
+
+    def parse_umbrella(self, header_paths: List[Path], clang_args: List[str] = None):
+        """Parse several headers as one translation unit
+
+        An in-memory umbrella header includes every target, so headers they
+        share (ZRCSDKTypes.h, STL, ...) are tokenized once instead of once per
+        target. Declarations are still only taken from the listed headers.
+        """
+        header_strs = [str(path.resolve()) for path in header_paths]
+        umbrella = str(self.sdk_include_path / '_all_headers.hpp')
+        content = ''.join(f'#include "{header}"\n' for header in header_strs)
+
+        classes, enums = self._parse_tu(
+            umbrella, header_strs, clang_args,
+            unsaved_files=[(umbrella, content)]
+        )
+        self.classes.update(classes)
+        self.enums.update(enums)
 
-        print(f"Parsing {header_path.name}...")
-        tu = self.index.parse(str(header_path), args=clang_args)
+    def _parse_tu(self, filename: str, target_files: List[str], clang_args=None,
+                  unsaved_files=None) -> Tuple[Dict[str, ClassInfo], Dict[str, EnumInfo]]:
+        """Parse one translation unit, collecting declarations from target_files"""
+        if clang_args is None:
+            clang_args = self._clang_args
+
+        cache_path = self._cache_path(target_files, clang_args)
+        mtimes = tuple(os.stat(target).st_mtime for target in target_files)
+        label = ', '.join(Path(target).name for target in target_files)
+        if self.use_cache:
+            cached = self._load_cache(cache_path, mtimes)
+            if cached is not None:
+                print(f"Using cached parse of {label}")
+                return cached
+
+        print(f"Parsing {label}...")
+        # Only declarations matter for bindings; skip function bodies and
+        # don't stop at headers that fail to resolve
+        tu = self.index.parse(
+            filename,
+            args=list(clang_args),
+            unsaved_files=unsaved_files,
+            options=TranslationUnit.PARSE_SKIP_FUNCTION_BODIES | TranslationUnit.PARSE_INCOMPLETE
+        )
 
         # Check for parse errors
         for diag in tu.diagnostics:
@@ -79,29 +205,80 @@ class SDKParser:
                 print(f"  Warning: {diag.spelling}")
 
         # Walk the AST
-        self._walk_cursor(tu.cursor, header_path)
-
-    def _walk_cursor(self, cursor, target_file: Path):
-        """Recursively walk AST cursor"""
-        # Only process declarations in the target file
-        if cursor.location.file and Path(cursor.location.file.name) == target_file:
-            if cursor.kind == CursorKind.CLASS_DECL or cursor.kind == CursorKind.STRUCT_DECL:
-                self._process_class(cursor)
-            elif cursor.kind == CursorKind.ENUM_DECL:
-                self._process_enum(cursor)
-
-        # Recurse to children
-        for child in cursor.get_children():
-            self._walk_cursor(child, target_file)
-
-    def _process_class(self, cursor):
+        result = self._walk_cursor(tu.cursor, frozenset(target_files))
+
+        if self.use_cache:
+            self._save_cache(cache_path, mtimes, result)
+        return result
+
+    def _cache_path(self, target_files: List[str], clang_args) -> Path:
+        """Cache file for a set of headers under the given args, class filter and parser"""
+        key = hashlib.sha1('\0'.join(
+            (*(str(Path(target).resolve()) for target in target_files), *clang_args, *self.accept_prefixes,
+             _SOURCE_HASH)
+        ).encode()).hexdigest()
+        return self.CACHE_DIR / f'{key}.pkl'
+
+    @staticmethod
+    def _load_cache(cache_path: Path, mtimes: Tuple[float, ...]):
+        """Return cached (classes, enums) if written for these header mtimes"""
+        try:
+            with cache_path.open('rb') as f:
+                cached_mtimes, result = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            return None
+        return result if cached_mtimes == mtimes else None
+
+    @staticmethod
+    def _save_cache(cache_path: Path, mtimes: Tuple[float, ...], result):
+        """Store parsed (classes, enums); failures only cost a re-parse"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with cache_path.open('wb') as f:
+                pickle.dump((mtimes, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"  Warning: could not write parse cache: {e}")
+
+    def _walk_cursor(self, cursor, target_files: Set[str]) -> Tuple[Dict[str, ClassInfo], Dict[str, EnumInfo]]:
+        """Walk the AST depth-first with an explicit stack"""
+        classes: Dict[str, ClassInfo] = {}
+        enums: Dict[str, EnumInfo] = {}
+
+        stack = [cursor]
+        while stack:
+            cursor = stack.pop()
+            kind = cursor.kind
+
+            # Only process declarations in the target files
+            if kind == _CLASS_DECL or kind == _STRUCT_DECL or kind == _ENUM_DECL:
+                loc = cursor.location.file
+                if loc is not None and loc.name in target_files:
+                    if kind == _ENUM_DECL:
+                        enum_info = self._process_enum(cursor)
+                        if enum_info:
+                            enums[enum_info.name] = enum_info
+                    else:
+                        class_info = self._process_class(cursor)
+                        if class_info:
+                            classes[class_info.name] = class_info
+
+            # Descend only into nodes that can hold class/enum declarations,
+            # pushing children reversed so they are visited in source order
+            if kind in _CONTAINER_KINDS:
+                children = list(cursor.get_children())
+                children.reverse()
+                stack.extend(children)
+
+        return classes, enums
+
+    def _process_class(self, cursor) -> Optional[ClassInfo]:
         """Process a class/struct declaration"""
         name = cursor.spelling
-        if not name or name.startswith('_'):
-            return  # Skip anonymous or internal classes
+        if not name or not name.startswith(self.accept_prefixes):
+            return None  # Skip anonymous, internal or unrelated classes
 
-        is_interface = name.startswith('I') and name[1].isupper()
-        is_sink = 'Sink' in name or 'Callback' in name
+        is_interface = name.startswith('I') and name[1:2].isupper()
+        is_sink = _is_sink_name(name) is not None
 
         class_info = ClassInfo(
             name=name,
@@ -110,22 +287,20 @@ class SDKParser:
             is_sink=is_sink
         )
 
-        # Get parent classes
-        for base in cursor.get_children():
-            if base.kind == CursorKind.CXX_BASE_SPECIFIER:
-                parent_name = base.type.spelling
+        # Get parent classes and methods in a single pass over children
+        for child in cursor.get_children():
+            kind = child.kind
+            if kind == _CXX_BASE_SPECIFIER:
+                parent_name = child.type.spelling
                 # Clean up the name (remove "class " prefix if present)
                 parent_name = parent_name.replace('class ', '').replace('struct ', '')
                 class_info.parent_classes.append(parent_name)
-
-        # Get methods
-        for child in cursor.get_children():
-            if child.kind == CursorKind.CXX_METHOD:
+            elif kind == _CXX_METHOD:
                 method = self._process_method(child)
                 if method:
                     class_info.methods.append(method)
 
-        self.classes[name] = class_info
+        return class_info
 
     def _process_method(self, cursor) -> Optional[MethodInfo]:
         """Process a method declaration"""
@@ -140,47 +315,133 @@ class SDKParser:
         # Get return type
         return_type = cursor.result_type.spelling
 
-        # Get parameters
+        # Get parameters, with a matching nb::arg() annotation for each
         params = []
+        arg_specs = []
         for arg in cursor.get_arguments():
             param_name = arg.spelling or f'arg{len(params)}'
             param_type = arg.type.spelling
             params.append((param_name, param_type))
+            if arg.type.get_canonical().kind in _NOCONVERT_KINDS:
+                arg_specs.append(f'nb::arg("{param_name}").noconvert()')
+            else:
+                arg_specs.append(f'nb::arg("{param_name}")')
 
         return MethodInfo(
             name=name,
             return_type=return_type,
             params=params,
+            param_decls=', '.join(f'{t} {n}' for n, t in params),
+            param_names=[n for n, t in params],
+            arg_specs=''.join(f', {spec}' for spec in arg_specs),
+            release_gil=name in GIL_RELEASE_METHODS,
             is_static=cursor.is_static_method(),
             is_const=cursor.is_const_method(),
             is_virtual=cursor.is_virtual_method(),
             is_pure_virtual=cursor.is_pure_virtual_method()
         )
 
-    def _process_enum(self, cursor):
+    def _process_enum(self, cursor) -> Optional[EnumInfo]:
         """Process an enum declaration"""
         name = cursor.spelling
         if not name or name.startswith('_'):
-            return
+            return None
 
         values = []
         for child in cursor.get_children():
-            if child.kind == CursorKind.ENUM_CONSTANT_DECL:
+            if child.kind == _ENUM_CONSTANT_DECL:
                 values.append((child.spelling, child.enum_value))
 
-        self.enums[name] = EnumInfo(name=name, values=values)
+        return EnumInfo(name=name, values=values)
+
+
+def _emit_defs(cls: ClassInfo) -> str:
+    """Statements binding every method of a class onto `cls`
+
+    Methods without annotations go through zrc_detail::bind_all() in one
+    call; the rest keep their own .def() with nb::arg / call_guard extras.
+    """
+    plain = [m for m in cls.methods if not (m.arg_specs or m.release_gil)]
+    annotated = [m for m in cls.methods if m.arg_specs or m.release_gil]
+
+    code = ''
+    if annotated:
+        code += '\n        cls' + '\n           '.join(
+            f'.def("{m.name}", &{cls.name}::{m.name}{m.arg_specs}'
+            f'{", nb::call_guard<nb::gil_scoped_release>()" if m.release_gil else ""})'
+            for m in annotated
+        ) + ';'
+    if plain:
+        code += '\n        zrc_detail::bind_all(cls,' + ','.join(
+            f'\n            std::pair{{"{m.name}", &{cls.name}::{m.name}}}' for m in plain
+        ) + ');'
+    return code
+
+
+def _emit_trampoline(cls: ClassInfo) -> str:
+    """Py<Sink> trampoline so Python subclasses can override the callbacks"""
+    methods = ''.join(
+        f"""
+    {m.return_type} {m.name}({m.param_decls}) override {{
+        NB_OVERRIDE{'_PURE' if m.is_pure_virtual else ''}({', '.join([m.name] + m.param_names)});
+    }}"""
+        for m in cls.methods
+    )
+    return f"""\
+class Py{cls.name} : public {cls.name} {{
+public:
+    NB_TRAMPOLINE({cls.name}, {len(cls.methods)});
+{methods}
+}};
+"""
+
+
+def _emit_enum(enum: EnumInfo) -> str:
+    """Enumerators as a constexpr table registered in one loop"""
+    values = ''.join(
+        f'\n            {{"{name}", {enum.name}::{name}}},' for name, _ in enum.values
+    )
+    extra = ', nb::is_arithmetic()' if enum.name in ARITHMETIC_ENUMS else ''
+    return f"""
+    {{
+        static constexpr std::pair<const char*, {enum.name}> k{enum.name}Values[] = {{{values}
+        }};
+        nb::enum_<{enum.name}> e(m, "{enum.name}"{extra});
+        for (const auto& [name, value] : k{enum.name}Values)
+            e.value(name, value);
+        e.export_values();
+    }}
+"""
+
+
+def _emit_class(cls: ClassInfo) -> str:
+    bases = ''.join(f', {base}' for base in cls.parent_classes)
+    return f"""
+    {{
+        nb::class_<{cls.name}{bases}> cls(m, "{cls.name}");{_emit_defs(cls)}
+    }}
+"""
+
+
+def _emit_sink_class(cls: ClassInfo) -> str:
+    return f"""
+    {{
+        nb::class_<{cls.name}, Py{cls.name}> cls(m, "{cls.name}");{_emit_defs(cls)}
+    }}
+"""
 
 
 class BindingGenerator:
-    """Generate pybind11 C++ code from parsed SDK info"""
+    """Generate nanobind C++ code from parsed SDK info"""
 
-    BINDING_TEMPLATE = """
-// Auto-generated pybind11 bindings for Zoom Rooms SDK
+    HEADER = """// Auto-generated nanobind bindings for Zoom Rooms SDK
 // Generated by binding_generator.py - DO NOT EDIT MANUALLY
 
-#include <pybind11/pybind11.h>
-#include <pybind11/stl.h>
-#include <pybind11/functional.h>
+#include <nanobind/nanobind.h>
+#include <nanobind/trampoline.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
+#include <nanobind/stl/function.h>
 
 // SDK headers
 #include "IZRCSDK.h"
@@ -200,89 +461,66 @@ class BindingGenerator:
 #include "ServiceComponents/IMeetingChatHelper.h"
 #include "ServiceComponents/ICameraControlHelper.h"
 
-namespace py = pybind11;
+namespace nb = nanobind;
 using namespace ZRCSDK;
 
-// Trampoline classes for callbacks (allow Python to override C++ virtual methods)
-{% for class in sink_classes %}
-class Py{{ class.name }} : public {{ class.name }} {
-public:
-    using {{ class.name }}::{{ class.name }};
-
-    {% for method in class.methods %}
-    {{ method.return_type }} {{ method.name }}({{ method.param_decls }}) override {
-        PYBIND11_OVERRIDE{% if method.is_pure_virtual %}_PURE{% endif %}(
-            {{ method.return_type }},
-            {{ class.name }},
-            {{ method.name }}{% for param in method.param_names %},
-            {{ param }}{% endfor %}
-        );
-    }
-    {% endfor %}
-};
-{% endfor %}
-
-PYBIND11_MODULE(zrc_sdk, m) {
-    m.doc() = "Zoom Rooms Controller SDK Python Bindings";
+namespace zrc_detail {
 
-    // ========== Enums ==========
-    {% for enum in enums %}
-    py::enum_<{{ enum.name }}>(m, "{{ enum.name }}")
-        {% for value_name, value_val in enum.values %}
-        .value("{{ value_name }}", {{ enum.name }}::{{ value_name }})
-        {% endfor %}
-        .export_values();
-    {% endfor %}
-
-    // ========== Core SDK Classes ==========
-    {% for class in core_classes %}
-    py::class_<{{ class.name }}{% if class.parent_classes %}, {{ class.parent_classes|join(', ') }}{% endif %}>(m, "{{ class.name }}")
-        {% for method in class.methods %}
-        .def("{{ method.name }}", &{{ class.name }}::{{ method.name }})
-        {% endfor %};
-    {% endfor %}
-
-    // ========== Sink/Callback Classes (with trampolines) ==========
-    {% for class in sink_classes %}
-    py::class_<{{ class.name }}, Py{{ class.name }}>(m, "{{ class.name }}")
-        {% for method in class.methods %}
-        .def("{{ method.name }}", &{{ class.name }}::{{ method.name }})
-        {% endfor %};
-    {% endfor %}
+// Binds each {name, &Class::Method} pair in one fold over the pack, so
+// methods without extra annotations don't need a .def() chain apiece
+template <class C, class... Ms>
+void bind_all(C& cls, Ms... methods) {
+    (cls.def(methods.first, methods.second), ...);
 }
+
+}  // namespace zrc_detail
+
+// Trampoline classes for callbacks (allow Python to override C++ virtual methods)
+"""
+
+    MODULE_BEGIN = """
+NB_MODULE(zrc_sdk, m) {
+    m.doc() = "Zoom Rooms Controller SDK Python Bindings";
 """
 
+    MODULE_END = "}\n"
+
     def __init__(self, parser: SDKParser):
         self.parser = parser
 
     def generate(self, output_path: Path):
-        """Generate pybind11 C++ binding code"""
+        """Generate nanobind C++ binding code"""
         print(f"\nGenerating bindings to {output_path}...")
 
-        # Separate core classes from sinks
-        core_classes = [c for c in self.parser.classes.values() if not c.is_sink]
-        sink_classes = [c for c in self.parser.classes.values() if c.is_sink]
-
-        # Prepare template data
-        template_data = {
-            'enums': list(self.parser.enums.values()),
-            'core_classes': core_classes,
-            'sink_classes': sink_classes,
-        }
-
-        # Enhance method info for template
-        for cls in sink_classes:
-            for method in cls.methods:
-                method.param_decls = ', '.join(f'{t} {n}' for n, t in method.params)
-                method.param_names = [n for n, t in method.params]
-
-        # Render template
-        template = Template(self.BINDING_TEMPLATE)
-        code = template.render(**template_data)
-
-        # Write output
+        # Separate core classes from sinks in one pass
+        core_classes, sink_classes = [], []
+        for cls in self.parser.classes.values():
+            (sink_classes if cls.is_sink else core_classes).append(cls)
+
+        # Plain string building: the output is a fixed skeleton with a few
+        # repeated blocks, so a template engine would only add overhead
+        code = ''.join([
+            self.HEADER,
+            *map(_emit_trampoline, sink_classes),
+            self.MODULE_BEGIN,
+            '\n    // ========== Enums ==========',
+            # Enums have no registration-order constraints, so sort them for
+            # output that doesn't depend on header order. Classes keep
+            # declaration order, which registers bases before subclasses.
+            *map(_emit_enum, sorted(self.parser.enums.values(), key=lambda e: e.name)),
+            '\n    // ========== Core SDK Classes ==========',
+            *map(_emit_class, core_classes),
+            '\n    // ========== Sink/Callback Classes (with trampolines) ==========',
+            *map(_emit_sink_class, sink_classes),
+            self.MODULE_END,
+        ])
+
+        # Write beside the target and swap it in, so an interrupted run
+        # can't leave a truncated .cpp for the build to choke on
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(code)
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        tmp_path.write_text(code)
+        os.replace(tmp_path, output_path)
 
         print(f"✓ Generated bindings for:")
         print(f"  - {len(self.parser.enums)} enums")
@@ -318,17 +556,21 @@ def main():
     # Create parser
     parser = SDKParser(str(sdk_include))
 
-    # Parse headers
+    # Resolve header locations
+    header_paths = []
     for header_name in headers_to_parse:
         header_path = sdk_include / 'include' / header_name
         if not header_path.exists():
             header_path = sdk_include / header_name
 
         if header_path.exists():
-            parser.parse_header(header_path)
+            header_paths.append(header_path)
         else:
             print(f"WARNING: Header not found: {header_name}")
 
+    # Parse all headers as a single translation unit
+    parser.parse_umbrella(header_paths)
+
     # Generate bindings
     generator = BindingGenerator(parser)
     generator.generate(output_file)
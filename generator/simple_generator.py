@@ -2,339 +2,633 @@
 """
 Simple Zoom Rooms SDK Binding Generator
 
-Generates pybind11 bindings from a configuration file.
+Generates nanobind bindings from the CLASSES table below.
 """
 
+import functools
+import hashlib
+import os
+import pickle
+import re
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict
+from types import MappingProxyType
+from typing import List, Mapping, NamedTuple, Tuple
+
+
+class SDKClass(NamedTuple):
+    name: str
+    kind: str  # 'enum', 'sink' or 'core'
+    # Overridable callbacks of a sink, as "Name(params) -> ret";
+    # " = 0" marks pure virtuals. Sinks listing any get a trampoline.
+    methods: Tuple[str, ...] = ()
+
+
+# Everything the module binds; the order here doesn't matter, see CLASSES
+_CLASSES = (
+    SDKClass('ZRCSDKError', 'enum'),
+    SDKClass('MeetingStatus', 'enum'),
+    SDKClass('ConnectionState', 'enum'),
+    SDKClass('ExitMeetingCmd', 'enum'),
+    SDKClass('RoomUnpairedReason', 'enum'),
+
+    SDKClass('IZRCSDKSink', 'sink', (
+        'OnGetDeviceManufacturer() -> std::string = 0',
+        'OnGetDeviceModel() -> std::string = 0',
+        'OnGetDeviceSerialNumber() -> std::string = 0',
+        'OnGetDeviceMacAddress() -> std::string = 0',
+        'OnGetDeviceIP() -> std::string = 0',
+        'OnGetFirmwareVersion() -> std::string = 0',
+        'OnGetAppName() -> std::string = 0',
+        'OnGetAppVersion() -> std::string = 0',
+        'OnGetAppDeveloper() -> std::string = 0',
+        'OnGetAppContact() -> std::string = 0',
+        'OnGetAppContentDirPath() -> std::string = 0',
+        'OnPromptToInputUserNamePasswordForProxyServer(const std::string& proxyHost, uint32_t port, const std::string& description) -> bool = 0',
+    )),
+    SDKClass('IZoomRoomsServiceSink', 'sink', (
+        'OnPairRoomResult(int32_t result) -> void = 0',
+        'OnRoomUnpairedReason(RoomUnpairedReason reason) -> void = 0',
+    )),
+    SDKClass('IMeetingServiceSink', 'sink', (
+        'OnUpdateMeetingStatus(MeetingStatus status) -> void',
+        'OnConfReadyNotification() -> void',
+        'OnExitMeetingNotification() -> void',
+    )),
+    SDKClass('IPreMeetingServiceSink', 'sink', (
+        'OnZRConnectionStateChanged(ConnectionState state) -> void',
+    )),
+    SDKClass('IProAVServiceSink', 'sink'),
+    SDKClass('IMeetingAudioHelperSink', 'sink'),
+    SDKClass('IMeetingVideoHelperSink', 'sink'),
+    SDKClass('IParticipantHelperSink', 'sink'),
+    SDKClass('IMeetingControlHelperSink', 'sink'),
+    SDKClass('ICameraControlHelperSink', 'sink'),
+
+    SDKClass('IZRCSDK', 'core'),
+    SDKClass('IZoomRoomsService', 'core'),
+    SDKClass('IMeetingService', 'core'),
+    SDKClass('IPreMeetingService', 'core'),
+    SDKClass('IProAVService', 'core'),
+    SDKClass('ISettingService', 'core'),
+    SDKClass('IPhoneCallService', 'core'),
+    SDKClass('IMeetingAudioHelper', 'core'),
+    SDKClass('IMeetingVideoHelper', 'core'),
+    SDKClass('IParticipantHelper', 'core'),
+    SDKClass('IMeetingControlHelper', 'core'),
+    SDKClass('IMeetingChatHelper', 'core'),
+    SDKClass('ICameraControlHelper', 'core'),
+)
+
+_KIND_ORDER = {'enum': 0, 'sink': 1, 'core': 2}
+
+# Registration order: enums, then sinks, then core classes, each sorted by
+# name (as are the sink methods). Reordering the table above therefore
+# renders byte-identical sources, which keeps ccache/ninja hits intact.
+CLASSES: Tuple[SDKClass, ...] = tuple(sorted(
+    (c._replace(methods=tuple(sorted(c.methods))) for c in _CLASSES),
+    key=lambda c: (_KIND_ORDER[c.kind], c.name),
+))
+
+ENUM_NAMES = frozenset(c.name for c in CLASSES if c.kind == 'enum')
+
+_PARAM_NAME = re.compile(r'(\w+)\s*$').search
+
+
+class MethodSig(NamedTuple):
+    name: str
+    ret: str
+    params: str
+    args: str
+    pure: bool
+
+
+def _parse_sig(sig: str) -> MethodSig:
+    """Split "Name(params) -> ret[ = 0]" into its parts"""
+    head, ret = sig.rsplit(' -> ', 1)
+    pure = ret.endswith(' = 0')
+    if pure:
+        ret = ret[:-len(' = 0')]
+    name, params = head.split('(', 1)
+    params = params[:-1]
+    # The argument name is the last identifier of each declaration
+    args = ', '.join(_PARAM_NAME(p).group(1) for p in params.split(',') if p.strip())
+    return MethodSig(name, ret, params, args, pure)
+
+
+# Sink signatures parsed once at import; trampolines are rendered from this
+PARSED_SINK_METHODS: Mapping[str, Tuple[MethodSig, ...]] = MappingProxyType({
+    cls.name: tuple(_parse_sig(sig) for sig in cls.methods)
+    for cls in CLASSES if cls.methods
+})
+
+
+GENERATED_BANNER = """// Auto-generated nanobind bindings for Zoom Rooms SDK
+// DO NOT EDIT MANUALLY - regenerate with simple_generator.py
+"""
 
+# Precompiled once by CMake and shared by every TU, which also keeps the
+# set of type casters identical across shards
+PCH_TEMPLATE = GENERATED_BANNER + """
+#pragma once
 
-# Simplified configuration - just list methods, we'll manually write the bindings
-SDK_CONFIG = {
-    'core_classes': [
-        'IZRCSDK',
-        'IZoomRoomsService',
-        'IMeetingService',
-        'IPreMeetingService',
-        'IProAVService',
-        'ISettingService',
-        'IPhoneCallService',
-        'IMeetingAudioHelper',
-        'IMeetingVideoHelper',
-        'IParticipantHelper',
-        'IMeetingControlHelper',
-        'IMeetingChatHelper',
-        'ICameraControlHelper',
-    ],
+#include <nanobind/nanobind.h>
+#include <nanobind/trampoline.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
+#include <nanobind/stl/function.h>
 
-    'sink_classes': [
-        'IZRCSDKSink',
-        'IZoomRoomsServiceSink',
-        'IMeetingServiceSink',
-        'IPreMeetingServiceSink',
-        'IProAVServiceSink',
-        'IMeetingAudioHelperSink',
-        'IMeetingVideoHelperSink',
-        'IParticipantHelperSink',
-        'IMeetingControlHelperSink',
-        'ICameraControlHelperSink',
-    ],
+#include "ZRCSDKTypes.h"
 
-    'enums': [
-        'ZRCSDKError',
-        'MeetingStatus',
-        'ConnectionState',
-        'ExitMeetingCmd',
-        'RoomUnpairedReason',
-    ],
+// Hand-written: SDK call lock, HeartBeat pump and the service's wrappers
+#include "zrc_service.h"
+
+namespace zrc_detail {
+
+// Binds each {name, &Class::Method} pair in one fold over the pack, so
+// methods without extra annotations don't need a .def() chain apiece
+template <class C, class... Ms>
+void bind_all(C& cls, Ms... methods) {
+    (cls.def(methods.first, methods.second), ...);
 }
 
+// bind_all for SDK entry points: each call drops the GIL and takes the SDK
+// lock, so it can't overlap a HeartBeat tick or stall other Python threads
+template <class C, class... Ms>
+void bind_sdk_calls(C& cls, Ms... methods) {
+    (cls.def(methods.first, methods.second, zrc_service::sdk_call()), ...);
+}
 
-BINDING_TEMPLATE = """// Auto-generated pybind11 bindings for Zoom Rooms SDK
-// DO NOT EDIT MANUALLY - regenerate with simple_generator.py
+}  // namespace zrc_detail
+"""
 
-#include <pybind11/pybind11.h>
-#include <pybind11/stl.h>
-#include <pybind11/functional.h>
-
-// SDK headers
-#include "IZRCSDK.h"
-#include "IZoomRoomsService.h"
-#include "IMeetingService.h"
-#include "IPreMeetingService.h"
-#include "IProAVService.h"
-#include "ISettingService.h"
-#include "IPhoneCallService.h"
-#include "ZRCSDKTypes.h"
-#include "ServiceComponents/IMeetingAudioHelper.h"
-#include "ServiceComponents/IMeetingVideoHelper.h"
-#include "ServiceComponents/IParticipantHelper.h"
-#include "ServiceComponents/IMeetingControlHelper.h"
-#include "ServiceComponents/IMeetingChatHelper.h"
-#include "ServiceComponents/ICameraControlHelper.h"
-
-namespace py = pybind11;
+SHARD_TEMPLATE = GENERATED_BANNER + """
+#include "zrc_pch.h"
+{includes}
+namespace nb = nanobind;
 using namespace ZRCSDK;
+{trampoline}
+void bind_{name}(nb::module_& m) {{
+{body}}}
+"""
 
-// Trampoline class for IZRCSDKSink to allow Python override
-class PyIZRCSDKSink : public IZRCSDKSink {
-public:
-    using IZRCSDKSink::IZRCSDKSink;
-
-    std::string OnGetDeviceManufacturer() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetDeviceManufacturer);
-    }
-    std::string OnGetDeviceModel() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetDeviceModel);
-    }
-    std::string OnGetDeviceSerialNumber() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetDeviceSerialNumber);
-    }
-    std::string OnGetDeviceMacAddress() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetDeviceMacAddress);
-    }
-    std::string OnGetDeviceIP() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetDeviceIP);
-    }
-    std::string OnGetFirmwareVersion() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetFirmwareVersion);
-    }
-    std::string OnGetAppName() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetAppName);
-    }
-    std::string OnGetAppVersion() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetAppVersion);
-    }
-    std::string OnGetAppDeveloper() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetAppDeveloper);
-    }
-    std::string OnGetAppContact() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetAppContact);
-    }
-    std::string OnGetAppContentDirPath() override {
-        PYBIND11_OVERRIDE_PURE(std::string, IZRCSDKSink, OnGetAppContentDirPath);
-    }
-    bool OnPromptToInputUserNamePasswordForProxyServer(const std::string& proxyHost, uint32_t port, const std::string& description) override {
-        PYBIND11_OVERRIDE_PURE(bool, IZRCSDKSink, OnPromptToInputUserNamePasswordForProxyServer, proxyHost, port, description);
-    }
-};
-
-// Trampoline for IZoomRoomsServiceSink
-class PyIZoomRoomsServiceSink : public IZoomRoomsServiceSink {
-public:
-    using IZoomRoomsServiceSink::IZoomRoomsServiceSink;
-
-    void OnPairRoomResult(int32_t result) override {
-        PYBIND11_OVERRIDE_PURE(void, IZoomRoomsServiceSink, OnPairRoomResult, result);
-    }
-    void OnRoomUnpairedReason(RoomUnpairedReason reason) override {
-        PYBIND11_OVERRIDE_PURE(void, IZoomRoomsServiceSink, OnRoomUnpairedReason, reason);
-    }
-};
-
-// Trampoline for IMeetingServiceSink
-class PyIMeetingServiceSink : public IMeetingServiceSink {
-public:
-    using IMeetingServiceSink::IMeetingServiceSink;
-
-    void OnUpdateMeetingStatus(MeetingStatus status) override {
-        PYBIND11_OVERRIDE(void, IMeetingServiceSink, OnUpdateMeetingStatus, status);
-    }
-    void OnConfReadyNotification() override {
-        PYBIND11_OVERRIDE(void, IMeetingServiceSink, OnConfReadyNotification);
-    }
-    void OnExitMeetingNotification() override {
-        PYBIND11_OVERRIDE(void, IMeetingServiceSink, OnExitMeetingNotification);
-    }
-};
-
-// Trampoline for IPreMeetingServiceSink
-class PyIPreMeetingServiceSink : public IPreMeetingServiceSink {
-public:
-    using IPreMeetingServiceSink::IPreMeetingServiceSink;
+MAIN_TEMPLATE = GENERATED_BANNER + """
+#include "zrc_pch.h"
 
-    void OnZRConnectionStateChanged(ConnectionState state) override {
-        PYBIND11_OVERRIDE(void, IPreMeetingServiceSink, OnZRConnectionStateChanged, state);
-    }
-};
+namespace nb = nanobind;
 
-PYBIND11_MODULE(zrc_sdk, m) {
+{declarations}
+NB_MODULE(zrc_sdk, m) {{
     m.doc() = "Zoom Rooms Controller SDK Python Bindings";
 
-    // ===== Key Enums =====
-    py::enum_<ZRCSDKError>(m, "ZRCSDKError")
-        .value("ZRCSDKERR_SUCCESS", ZRCSDKError::ZRCSDKERR_SUCCESS)
-        .value("ZRCSDKERR_WRONG_USAGE", ZRCSDKError::ZRCSDKERR_WRONG_USAGE)
-        .export_values();
-
-    py::enum_<MeetingStatus>(m, "MeetingStatus")
-        .value("Idle", MeetingStatus::Idle)
-        .value("Connecting", MeetingStatus::Connecting)
-        .value("InMeeting", MeetingStatus::InMeeting)
-        .value("Disconnecting", MeetingStatus::Disconnecting)
-        .export_values();
-
-    py::enum_<ConnectionState>(m, "ConnectionState")
-        .value("ConnectionStateNone", ConnectionState::ConnectionStateNone)
-        .value("ConnectionStateEstablished", ConnectionState::ConnectionStateEstablished)
-        .value("ConnectionStateConnected", ConnectionState::ConnectionStateConnected)
-        .value("ConnectionStateDisconnected", ConnectionState::ConnectionStateDisconnected)
-        .export_values();
-
-    py::enum_<ExitMeetingCmd>(m, "ExitMeetingCmd")
-        .value("Leave", ExitMeetingCmd::Leave)
-        .value("End", ExitMeetingCmd::End)
-        .export_values();
-
-    py::enum_<RoomUnpairedReason>(m, "RoomUnpairedReason")
-        .value("RoomUnpairedReason_TokenInvalid", RoomUnpairedReason::RoomUnpairedReason_TokenInvalid)
-        .value("RoomUnpairedReason_RefreshTokenFail", RoomUnpairedReason::RoomUnpairedReason_RefreshTokenFail)
-        .export_values();
-
-    // ===== SDK Sinks (Callbacks) =====
-    py::class_<IZRCSDKSink, PyIZRCSDKSink>(m, "IZRCSDKSink")
-        .def(py::init<>())
-        .def("OnGetDeviceManufacturer", &IZRCSDKSink::OnGetDeviceManufacturer)
-        .def("OnGetDeviceModel", &IZRCSDKSink::OnGetDeviceModel)
-        .def("OnGetDeviceSerialNumber", &IZRCSDKSink::OnGetDeviceSerialNumber)
-        .def("OnGetDeviceMacAddress", &IZRCSDKSink::OnGetDeviceMacAddress)
-        .def("OnGetDeviceIP", &IZRCSDKSink::OnGetDeviceIP)
-        .def("OnGetFirmwareVersion", &IZRCSDKSink::OnGetFirmwareVersion)
-        .def("OnGetAppName", &IZRCSDKSink::OnGetAppName)
-        .def("OnGetAppVersion", &IZRCSDKSink::OnGetAppVersion)
-        .def("OnGetAppDeveloper", &IZRCSDKSink::OnGetAppDeveloper)
-        .def("OnGetAppContact", &IZRCSDKSink::OnGetAppContact)
-        .def("OnGetAppContentDirPath", &IZRCSDKSink::OnGetAppContentDirPath);
-
-    py::class_<IZoomRoomsServiceSink, PyIZoomRoomsServiceSink>(m, "IZoomRoomsServiceSink")
-        .def(py::init<>())
-        .def("OnPairRoomResult", &IZoomRoomsServiceSink::OnPairRoomResult)
-        .def("OnRoomUnpairedReason", &IZoomRoomsServiceSink::OnRoomUnpairedReason);
-
-    py::class_<IMeetingServiceSink, PyIMeetingServiceSink>(m, "IMeetingServiceSink")
-        .def(py::init<>())
-        .def("OnUpdateMeetingStatus", &IMeetingServiceSink::OnUpdateMeetingStatus)
-        .def("OnConfReadyNotification", &IMeetingServiceSink::OnConfReadyNotification)
-        .def("OnExitMeetingNotification", &IMeetingServiceSink::OnExitMeetingNotification);
-
-    py::class_<IPreMeetingServiceSink, PyIPreMeetingServiceSink>(m, "IPreMeetingServiceSink")
-        .def(py::init<>())
-        .def("OnZRConnectionStateChanged", &IPreMeetingServiceSink::OnZRConnectionStateChanged);
-
-    // Simple sinks without trampolines (no methods to override)
-    py::class_<IProAVServiceSink>(m, "IProAVServiceSink")
-        .def(py::init<>());
-
-    py::class_<IMeetingAudioHelperSink>(m, "IMeetingAudioHelperSink")
-        .def(py::init<>());
-
-    py::class_<IMeetingVideoHelperSink>(m, "IMeetingVideoHelperSink")
-        .def(py::init<>());
-
-    py::class_<IParticipantHelperSink>(m, "IParticipantHelperSink")
-        .def(py::init<>());
-
-    py::class_<IMeetingControlHelperSink>(m, "IMeetingControlHelperSink")
-        .def(py::init<>());
-
-    py::class_<ICameraControlHelperSink>(m, "ICameraControlHelperSink")
-        .def(py::init<>());
-
-    // ===== Core SDK Class =====
-    py::class_<IZRCSDK>(m, "IZRCSDK")
-        .def_static("GetInstance", &IZRCSDK::GetInstance, py::return_value_policy::reference)
-        .def_static("DestroyInstance", &IZRCSDK::DestroyInstance)
-        .def("RegisterSink", &IZRCSDK::RegisterSink)
-        .def("HeartBeat", &IZRCSDK::HeartBeat)
-        .def("ForceFlushLog", &IZRCSDK::ForceFlushLog)
-        .def("CreateZoomRoomsService", &IZRCSDK::CreateZoomRoomsService,
-             py::arg("roomID") = ZRCSDK_DEFAULT_ROOM_ID,
-             py::return_value_policy::reference)
-        .def("QueryAllZoomRoomsServices", &IZRCSDK::QueryAllZoomRoomsServices);
-
-    // ===== ZoomRooms Service =====
-    py::class_<IZoomRoomsService>(m, "IZoomRoomsService")
-        .def("RegisterSink", &IZoomRoomsService::RegisterSink)
-        .def("DeregisterSink", &IZoomRoomsService::DeregisterSink)
-        .def("PairRoomWithActivationCode", &IZoomRoomsService::PairRoomWithActivationCode)
-        .def("UnpairRoom", &IZoomRoomsService::UnpairRoom)
-        .def("RetryToPairRoom", &IZoomRoomsService::RetryToPairRoom)
-        .def("GetSettingService", &IZoomRoomsService::GetSettingService, py::return_value_policy::reference)
-        .def("GetPreMeetingService", &IZoomRoomsService::GetPreMeetingService, py::return_value_policy::reference)
-        .def("GetMeetingService", &IZoomRoomsService::GetMeetingService, py::return_value_policy::reference)
-        .def("GetPhoneCallService", &IZoomRoomsService::GetPhoneCallService, py::return_value_policy::reference)
-        .def("GetProAVService", &IZoomRoomsService::GetProAVService, py::return_value_policy::reference);
-
-    // ===== Pre-Meeting Service =====
-    py::class_<IPreMeetingService>(m, "IPreMeetingService")
-        .def("RegisterSink", &IPreMeetingService::RegisterSink)
-        .def("DeregisterSink", &IPreMeetingService::DeregisterSink)
-        .def("GetConnectionState", &IPreMeetingService::GetConnectionState);
-
-    // ===== Meeting Service =====
-    py::class_<IMeetingService>(m, "IMeetingService")
-        .def("RegisterSink", &IMeetingService::RegisterSink)
-        .def("DeregisterSink", &IMeetingService::DeregisterSink)
-        .def("GetMeetingAudioHelper", &IMeetingService::GetMeetingAudioHelper, py::return_value_policy::reference)
-        .def("GetMeetingVideoHelper", &IMeetingService::GetMeetingVideoHelper, py::return_value_policy::reference)
-        .def("GetParticipantHelper", &IMeetingService::GetParticipantHelper, py::return_value_policy::reference)
-        .def("GetMeetingControlHelper", &IMeetingService::GetMeetingControlHelper, py::return_value_policy::reference)
-        .def("GetMeetingChatHelper", &IMeetingService::GetMeetingChatHelper, py::return_value_policy::reference)
-        .def("GetCameraControlHelper", &IMeetingService::GetCameraControlHelper, py::return_value_policy::reference)
-        .def("StartInstantMeeting", &IMeetingService::StartInstantMeeting)
-        .def("JoinMeeting", &IMeetingService::JoinMeeting)
-        .def("ExitMeeting", &IMeetingService::ExitMeeting);
-
-    // ===== Pro AV Service =====
-    py::class_<IProAVService>(m, "IProAVService")
-        .def("RegisterSink", &IProAVService::RegisterSink)
-        .def("DeregisterSink", &IProAVService::DeregisterSink);
-
-    // ===== Setting Service =====
-    py::class_<ISettingService>(m, "ISettingService");
-
-    // ===== Phone Call Service =====
-    py::class_<IPhoneCallService>(m, "IPhoneCallService");
-
-    // ===== Helper Classes =====
-    py::class_<IMeetingAudioHelper>(m, "IMeetingAudioHelper")
-        .def("RegisterSink", &IMeetingAudioHelper::RegisterSink)
-        .def("DeregisterSink", &IMeetingAudioHelper::DeregisterSink);
-
-    py::class_<IMeetingVideoHelper>(m, "IMeetingVideoHelper")
-        .def("RegisterSink", &IMeetingVideoHelper::RegisterSink)
-        .def("DeregisterSink", &IMeetingVideoHelper::DeregisterSink);
-
-    py::class_<IParticipantHelper>(m, "IParticipantHelper")
-        .def("RegisterSink", &IParticipantHelper::RegisterSink)
-        .def("DeregisterSink", &IParticipantHelper::DeregisterSink);
-
-    py::class_<IMeetingControlHelper>(m, "IMeetingControlHelper")
-        .def("RegisterSink", &IMeetingControlHelper::RegisterSink)
-        .def("DeregisterSink", &IMeetingControlHelper::DeregisterSink);
-
-    py::class_<ICameraControlHelper>(m, "ICameraControlHelper")
-        .def("RegisterSink", &ICameraControlHelper::RegisterSink)
-        .def("DeregisterSink", &ICameraControlHelper::DeregisterSink);
-
-    py::class_<IMeetingChatHelper>(m, "IMeetingChatHelper")
-        .def("RegisterSink", &IMeetingChatHelper::RegisterSink)
-        .def("DeregisterSink", &IMeetingChatHelper::DeregisterSink);
-}
+{calls}
+    // RegisterSDKSink, HeartBeat pump, GetConnectionStates (bindings/zrc_service.cpp)
+    zrc_service::bind(m);
+}}
 """
 
+TRAMPOLINE_TEMPLATE = """
+// Trampoline for {name} to allow Python override
+class Py{name} : public {name} {{
+public:
+    NB_TRAMPOLINE({name}, {count});
+{methods}}};
+"""
+
+TRAMPOLINE_METHOD_TEMPLATE = """
+    {ret} {name}({params}) override {{
+        {override}({args});
+    }}"""
+
+
+# Body of bind_<Name>() for every entry in CLASSES
+BINDINGS: Mapping[str, str] = MappingProxyType({
+    # ===== Key Enums =====
+    'ZRCSDKError': """\
+    static constexpr std::pair<const char*, ZRCSDKError> kZRCSDKErrorValues[] = {
+        {"ZRCSDKERR_SUCCESS", ZRCSDKError::ZRCSDKERR_SUCCESS},
+        {"ZRCSDKERR_INTERNAL_ERROR", ZRCSDKError::ZRCSDKERR_INTERNAL_ERROR},
+    };
+    nb::enum_<ZRCSDKError> e(m, "ZRCSDKError", nb::is_arithmetic());
+    for (const auto& [name, value] : kZRCSDKErrorValues)
+        e.value(name, value);
+    e.export_values();
+""",
+    'MeetingStatus': """\
+    static constexpr std::pair<const char*, MeetingStatus> kMeetingStatusValues[] = {
+        {"MeetingStatusNotInMeeting", MeetingStatus::MeetingStatusNotInMeeting},
+        {"MeetingStatusConnectingToMeeting", MeetingStatus::MeetingStatusConnectingToMeeting},
+        {"MeetingStatusInMeeting", MeetingStatus::MeetingStatusInMeeting},
+        {"MeetingStatusLoggedOut", MeetingStatus::MeetingStatusLoggedOut},
+    };
+    nb::enum_<MeetingStatus> e(m, "MeetingStatus");
+    for (const auto& [name, value] : kMeetingStatusValues)
+        e.value(name, value);
+    e.export_values();
+""",
+    'ConnectionState': """\
+    static constexpr std::pair<const char*, ConnectionState> kConnectionStateValues[] = {
+        {"ConnectionStateNone", ConnectionState::ConnectionStateNone},
+        {"ConnectionStateEstablished", ConnectionState::ConnectionStateEstablished},
+        {"ConnectionStateConnected", ConnectionState::ConnectionStateConnected},
+        {"ConnectionStateDisconnected", ConnectionState::ConnectionStateDisconnected},
+    };
+    nb::enum_<ConnectionState> e(m, "ConnectionState");
+    for (const auto& [name, value] : kConnectionStateValues)
+        e.value(name, value);
+    e.export_values();
+""",
+    'ExitMeetingCmd': """\
+    static constexpr std::pair<const char*, ExitMeetingCmd> kExitMeetingCmdValues[] = {
+        {"ExitMeetingCmdLeave", ExitMeetingCmd::ExitMeetingCmdLeave},
+        {"ExitMeetingCmdEnd", ExitMeetingCmd::ExitMeetingCmdEnd},
+    };
+    nb::enum_<ExitMeetingCmd> e(m, "ExitMeetingCmd");
+    for (const auto& [name, value] : kExitMeetingCmdValues)
+        e.value(name, value);
+    e.export_values();
+""",
+    'RoomUnpairedReason': """\
+    static constexpr std::pair<const char*, RoomUnpairedReason> kRoomUnpairedReasonValues[] = {
+        {"RoomUnpairedReason_TokenInvalid", RoomUnpairedReason::RoomUnpairedReason_TokenInvalid},
+        {"RoomUnpairedReason_RefreshTokenFail", RoomUnpairedReason::RoomUnpairedReason_RefreshTokenFail},
+    };
+    nb::enum_<RoomUnpairedReason> e(m, "RoomUnpairedReason");
+    for (const auto& [name, value] : kRoomUnpairedReasonValues)
+        e.value(name, value);
+    e.export_values();
+""",
+
+    # ===== SDK Sinks (Callbacks) =====
+    'IZRCSDKSink': """\
+    nb::class_<IZRCSDKSink, PyIZRCSDKSink> cls(m, "IZRCSDKSink");
+    cls.def(nb::init<>());
+    zrc_detail::bind_all(cls,
+        std::pair{"OnGetDeviceManufacturer", &IZRCSDKSink::OnGetDeviceManufacturer},
+        std::pair{"OnGetDeviceModel", &IZRCSDKSink::OnGetDeviceModel},
+        std::pair{"OnGetDeviceSerialNumber", &IZRCSDKSink::OnGetDeviceSerialNumber},
+        std::pair{"OnGetDeviceMacAddress", &IZRCSDKSink::OnGetDeviceMacAddress},
+        std::pair{"OnGetDeviceIP", &IZRCSDKSink::OnGetDeviceIP},
+        std::pair{"OnGetFirmwareVersion", &IZRCSDKSink::OnGetFirmwareVersion},
+        std::pair{"OnGetAppName", &IZRCSDKSink::OnGetAppName},
+        std::pair{"OnGetAppVersion", &IZRCSDKSink::OnGetAppVersion},
+        std::pair{"OnGetAppDeveloper", &IZRCSDKSink::OnGetAppDeveloper},
+        std::pair{"OnGetAppContact", &IZRCSDKSink::OnGetAppContact},
+        std::pair{"OnGetAppContentDirPath", &IZRCSDKSink::OnGetAppContentDirPath});
+""",
+    'IZoomRoomsServiceSink': """\
+    nb::class_<IZoomRoomsServiceSink, PyIZoomRoomsServiceSink>(m, "IZoomRoomsServiceSink")
+        .def(nb::init<>())
+        .def("OnPairRoomResult", &IZoomRoomsServiceSink::OnPairRoomResult, nb::arg("result").noconvert())
+        .def("OnRoomUnpairedReason", &IZoomRoomsServiceSink::OnRoomUnpairedReason, nb::arg("reason").noconvert());
+""",
+    'IMeetingServiceSink': """\
+    nb::class_<IMeetingServiceSink, PyIMeetingServiceSink> cls(m, "IMeetingServiceSink");
+    cls.def(nb::init<>())
+       .def("OnUpdateMeetingStatus", &IMeetingServiceSink::OnUpdateMeetingStatus, nb::arg("status").noconvert());
+    zrc_detail::bind_all(cls,
+        std::pair{"OnConfReadyNotification", &IMeetingServiceSink::OnConfReadyNotification},
+        std::pair{"OnExitMeetingNotification", &IMeetingServiceSink::OnExitMeetingNotification});
+""",
+    'IPreMeetingServiceSink': """\
+    nb::class_<IPreMeetingServiceSink, PyIPreMeetingServiceSink>(m, "IPreMeetingServiceSink")
+        .def(nb::init<>())
+        .def("OnZRConnectionStateChanged", &IPreMeetingServiceSink::OnZRConnectionStateChanged, nb::arg("state").noconvert());
+""",
+    # Simple sinks without trampolines (no methods to override)
+    'IProAVServiceSink': """\
+    nb::class_<IProAVServiceSink>(m, "IProAVServiceSink")
+        .def(nb::init<>());
+""",
+    'IMeetingAudioHelperSink': """\
+    nb::class_<IMeetingAudioHelperSink>(m, "IMeetingAudioHelperSink")
+        .def(nb::init<>());
+""",
+    'IMeetingVideoHelperSink': """\
+    nb::class_<IMeetingVideoHelperSink>(m, "IMeetingVideoHelperSink")
+        .def(nb::init<>());
+""",
+    'IParticipantHelperSink': """\
+    nb::class_<IParticipantHelperSink>(m, "IParticipantHelperSink")
+        .def(nb::init<>());
+""",
+    'IMeetingControlHelperSink': """\
+    nb::class_<IMeetingControlHelperSink>(m, "IMeetingControlHelperSink")
+        .def(nb::init<>());
+""",
+    'ICameraControlHelperSink': """\
+    nb::class_<ICameraControlHelperSink>(m, "ICameraControlHelperSink")
+        .def(nb::init<>());
+""",
+
+    # ===== Core SDK Class =====
+    'IZRCSDK': """\
+    nb::class_<IZRCSDK> cls(m, "IZRCSDK");
+    cls.def_static("GetInstance", &IZRCSDK::GetInstance, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def_static("DestroyInstance", &IZRCSDK::DestroyInstance, zrc_service::sdk_call())
+       .def("CreateZoomRoomsService", &IZRCSDK::CreateZoomRoomsService,
+            nb::arg("roomID") = ZRCSDK_DEFAULT_ROOM_ID,
+            nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("QueryAllZoomRoomsServices", &zrc_service::query_all_zoom_rooms_services);
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"HeartBeat", &IZRCSDK::HeartBeat},
+        std::pair{"RegisterSink", &IZRCSDK::RegisterSink},
+        std::pair{"ForceFlushLog", &IZRCSDK::ForceFlushLog});
+""",
+
+    # ===== Services =====
+    'IZoomRoomsService': """\
+    nb::class_<IZoomRoomsService> cls(m, "IZoomRoomsService");
+    cls.def("PairRoomWithActivationCode", &IZoomRoomsService::PairRoomWithActivationCode, nb::arg("activationCode"),
+            zrc_service::sdk_call())
+       .def("GetSettingService", &IZoomRoomsService::GetSettingService, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetPreMeetingService", &IZoomRoomsService::GetPreMeetingService, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetMeetingService", &IZoomRoomsService::GetMeetingService, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetPhoneCallService", &IZoomRoomsService::GetPhoneCallService, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetProAVService", &IZoomRoomsService::GetProAVService, nb::rv_policy::reference, zrc_service::sdk_call());
+    // Sinks are plain Python objects, wrapped by zrc_service
+    cls.def("RegisterSink", &zrc_service::register_room_service_sink)
+       .def("DeregisterSink", &zrc_service::deregister_room_service_sink);
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"UnpairRoom", &IZoomRoomsService::UnpairRoom},
+        std::pair{"RetryToPairRoom", &IZoomRoomsService::RetryToPairRoom});
+""",
+    'IPreMeetingService': """\
+    nb::class_<IPreMeetingService> cls(m, "IPreMeetingService");
+    cls.def("GetConnectionState", &zrc_service::get_connection_state)
+       .def("RegisterSink", &zrc_service::register_premeeting_sink)
+       .def("DeregisterSink", &zrc_service::deregister_premeeting_sink);
+""",
+    'IMeetingService': """\
+    nb::class_<IMeetingService> cls(m, "IMeetingService");
+    cls.def("GetMeetingAudioHelper", &IMeetingService::GetMeetingAudioHelper, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetMeetingVideoHelper", &IMeetingService::GetMeetingVideoHelper, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetParticipantHelper", &IMeetingService::GetParticipantHelper, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetMeetingControlHelper", &IMeetingService::GetMeetingControlHelper, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetMeetingChatHelper", &IMeetingService::GetMeetingChatHelper, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("GetCameraControlHelper", &IMeetingService::GetCameraControlHelper, nb::rv_policy::reference, zrc_service::sdk_call())
+       .def("JoinMeeting", &IMeetingService::JoinMeeting, nb::arg("meetingNumber"), nb::arg("password"),
+            zrc_service::sdk_call())
+       .def("ExitMeeting", &IMeetingService::ExitMeeting, nb::arg("cmd").noconvert(), zrc_service::sdk_call())
+       .def("StartInstantMeeting", &IMeetingService::StartInstantMeeting, zrc_service::sdk_call())
+       .def("RegisterSink", &zrc_service::register_meeting_sink)
+       .def("DeregisterSink", &zrc_service::deregister_meeting_sink);
+""",
+    'IProAVService': """\
+    nb::class_<IProAVService> cls(m, "IProAVService");
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"RegisterSink", &IProAVService::RegisterSink},
+        std::pair{"DeregisterSink", &IProAVService::DeregisterSink});
+""",
+    'ISettingService': """\
+    nb::class_<ISettingService>(m, "ISettingService");
+""",
+    'IPhoneCallService': """\
+    nb::class_<IPhoneCallService>(m, "IPhoneCallService");
+""",
+
+    # ===== Helper Classes =====
+    'IMeetingAudioHelper': """\
+    nb::class_<IMeetingAudioHelper> cls(m, "IMeetingAudioHelper");
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"RegisterSink", &IMeetingAudioHelper::RegisterSink},
+        std::pair{"DeregisterSink", &IMeetingAudioHelper::DeregisterSink});
+""",
+    'IMeetingVideoHelper': """\
+    nb::class_<IMeetingVideoHelper> cls(m, "IMeetingVideoHelper");
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"RegisterSink", &IMeetingVideoHelper::RegisterSink},
+        std::pair{"DeregisterSink", &IMeetingVideoHelper::DeregisterSink});
+""",
+    'IParticipantHelper': """\
+    nb::class_<IParticipantHelper> cls(m, "IParticipantHelper");
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"RegisterSink", &IParticipantHelper::RegisterSink},
+        std::pair{"DeregisterSink", &IParticipantHelper::DeregisterSink});
+""",
+    'IMeetingControlHelper': """\
+    nb::class_<IMeetingControlHelper> cls(m, "IMeetingControlHelper");
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"RegisterSink", &IMeetingControlHelper::RegisterSink},
+        std::pair{"DeregisterSink", &IMeetingControlHelper::DeregisterSink});
+""",
+    'ICameraControlHelper': """\
+    nb::class_<ICameraControlHelper> cls(m, "ICameraControlHelper");
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"RegisterSink", &ICameraControlHelper::RegisterSink},
+        std::pair{"DeregisterSink", &ICameraControlHelper::DeregisterSink});
+""",
+    'IMeetingChatHelper': """\
+    nb::class_<IMeetingChatHelper> cls(m, "IMeetingChatHelper");
+    zrc_detail::bind_sdk_calls(cls,
+        std::pair{"RegisterSink", &IMeetingChatHelper::RegisterSink},
+        std::pair{"DeregisterSink", &IMeetingChatHelper::DeregisterSink});
+""",
+})
+
+
+# Interfaces handed out by a class's methods; nanobind needs them complete
+_RETURNED_TYPES = {
+    'IZRCSDK': ['IZoomRoomsService'],
+    'IZoomRoomsService': [
+        'ISettingService',
+        'IPreMeetingService',
+        'IMeetingService',
+        'IPhoneCallService',
+        'IProAVService',
+    ],
+    'IMeetingService': [
+        'IMeetingAudioHelper',
+        'IMeetingVideoHelper',
+        'IParticipantHelper',
+        'IMeetingControlHelper',
+        'IMeetingChatHelper',
+        'ICameraControlHelper',
+    ],
+}
+
+RETURNED_TYPES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    name: tuple(sorted(types)) for name, types in _RETURNED_TYPES.items()
+})
+
+
+# Already in zrc_pch.h, so shards don't include it again
+PCH_SDK_HEADER = 'ZRCSDKTypes.h'
+
+
+def sdk_header(name: str) -> str:
+    """SDK header that declares `name`, relative to the include path
+
+    Enums live in ZRCSDKTypes.h, sinks are declared next to the interface
+    they serve, and helpers sit under ServiceComponents/.
+    """
+    if name in ENUM_NAMES:
+        return PCH_SDK_HEADER
+    if name.endswith('Sink'):
+        name = name[:-len('Sink')]
+    if name.endswith('Helper'):
+        return f'ServiceComponents/{name}.h'
+    return f'{name}.h'
+
+
+def binding_order() -> List[str]:
+    """Names in registration order: enums, then sinks, then core classes"""
+    return [c.name for c in CLASSES]
+
+
+def render_trampoline(name: str) -> str:
+    """Render the Py<name> trampoline for a sink with overridable methods"""
+    methods = PARSED_SINK_METHODS.get(name)
+    if not methods:
+        return ''
+    return TRAMPOLINE_TEMPLATE.format(
+        name=name,
+        count=len(methods),
+        methods=''.join(
+            TRAMPOLINE_METHOD_TEMPLATE.format(
+                ret=m.ret,
+                name=m.name,
+                params=m.params,
+                override='NB_OVERRIDE_PURE' if m.pure else 'NB_OVERRIDE',
+                args=', '.join(filter(None, (m.name, m.args))),
+            )
+            for m in methods
+        ) + '\n',
+    )
+
+
+def render_shard(name: str) -> str:
+    """Render the translation unit defining bind_<name>()"""
+    headers = [sdk_header(name)] + [sdk_header(t) for t in RETURNED_TYPES.get(name, ())]
+    return SHARD_TEMPLATE.format(
+        includes=''.join(f'#include "{header}"\n' for header in headers if header != PCH_SDK_HEADER),
+        trampoline=render_trampoline(name),
+        name=name,
+        body=BINDINGS[name],
+    )
+
+
+def render_main(names: List[str]) -> str:
+    """Render the module TU that calls every bind_<name>() from NB_MODULE"""
+    return MAIN_TEMPLATE.format(
+        declarations=''.join(f'void bind_{name}(nb::module_& m);\n' for name in names),
+        calls=''.join(f'    bind_{name}(m);\n' for name in names),
+    )
+
+
+def write_if_changed(output_path: Path, code: str) -> bool:
+    """Write code to output_path unless it already has identical contents
+
+    Leaving an unchanged file alone keeps its mtime, so make/ninja don't
+    recompile the bindings after a no-op regeneration. Changed files are
+    written to a sibling .tmp and swapped in with os.replace(), so an
+    interrupted run never leaves a truncated source behind.
+    """
+    data = code.encode()
+    if output_path.exists() and output_path.read_bytes() == data:
+        return False
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, output_path)
+    return True
+
+
+def output_paths(output_path: Path) -> List[Path]:
+    """Every file generate_bindings() writes: PCH, module TU, then shards"""
+    shard_dir = output_path.parent
+    return [shard_dir / 'zrc_pch.h', output_path] + [
+        shard_dir / f'zrc_bind_{name}.cpp' for name in binding_order()
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def generator_hash() -> str:
+    """Fingerprint of everything the output depends on
+
+    The config, snippets and templates all live in this file, so hashing its
+    source covers any change that could alter the generated code.
+    """
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def fingerprint(paths: List[Path]) -> str:
+    """Sidecar contents: generator_hash(), then a hash of each output file
+
+    Hashing the outputs too means a hand-edited or checked-out file no
+    longer reads as up to date. Raises OSError if an output is missing.
+    """
+    lines = [generator_hash()]
+    for path in paths:
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        lines.append(f'{digest}  {path.name}')
+    return '\n'.join(lines) + '\n'
+
+
+@functools.lru_cache(maxsize=4)
+def render_all(key: str) -> Tuple[str, ...]:
+    """Code for every output, in output_paths() order
+
+    Memoized per generator_hash() in-process, and pickled under
+    __pycache__/ so later runs of an unchanged generator reuse it.
+    """
+    cache_dir = Path(__file__).parent / '__pycache__'
+    cache_file = cache_dir / f'bindings-{key}.pkl'
+    try:
+        with cache_file.open('rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    names = binding_order()
+    rendered = (PCH_TEMPLATE, render_main(names), *map(render_shard, names))
+
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        for old in cache_dir.glob('bindings-*.pkl'):
+            old.unlink()
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        with tmp_file.open('wb') as f:
+            pickle.dump(rendered, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass  # Read-only checkout; the in-process cache still applies
+    return rendered
+
 
 def generate_bindings(output_path: Path):
-    """Generate the pybind11 C++ file"""
+    """Generate the nanobind C++ sources
+
+    output_path holds NB_MODULE; every CLASSES entry gets its own
+    zrc_bind_<Name>.cpp next to it so the classes compile in parallel and
+    editing one class only rebuilds its shard. The nanobind headers they
+    all share go in zrc_pch.h, which CMake precompiles.
+    """
     print("Generating Zoom Rooms SDK bindings...")
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(BINDING_TEMPLATE)
+    names = binding_order()
+    shard_dir = output_path.parent
+    outputs = dict(zip(output_paths(output_path), render_all(generator_hash())))
 
-    print(f"✓ Generated: {output_path}")
-    print(f"  - {len(SDK_CONFIG['core_classes'])} core classes")
-    print(f"  - {len(SDK_CONFIG['sink_classes'])} sink classes")
-    print(f"  - {len(SDK_CONFIG['enums'])} enums")
+    written = 0
+    for path, code in outputs.items():
+        written += write_if_changed(path, code)
+
+    # Shards for classes dropped from CLASSES would still be globbed by CMake
+    for stale in shard_dir.glob('zrc_bind_*.cpp'):
+        if stale not in outputs:
+            stale.unlink()
+            print(f"✓ Removed stale shard: {stale}")
+
+    if written:
+        print(f"✓ Generated: {output_path} + {len(names)} shards ({written} updated)")
+    else:
+        print(f"✓ Up to date: {output_path} + {len(names)} shards")
+    counts = Counter(c.kind for c in CLASSES)
+    print(f"  - {counts['core']} core classes")
+    print(f"  - {counts['sink']} sink classes")
+    print(f"  - {counts['enum']} enums")
 
 
 def main():
@@ -342,11 +636,24 @@ def main():
     project_root = script_dir.parent
     output_file = project_root / 'bindings' / 'zrc_bindings.cpp'
 
+    # Skip rendering entirely when neither this script nor any output has
+    # changed since the last run
+    outputs = output_paths(output_file)
+    hash_file = output_file.with_suffix('.cpp.genhash')
+    try:
+        up_to_date = hash_file.read_text() == fingerprint(outputs)
+    except OSError:
+        up_to_date = False
+    if up_to_date:
+        print(f"✓ Bindings up to date: {output_file}")
+        return
+
     print("=" * 60)
     print("Zoom Rooms SDK Binding Generator (Simple)")
     print("=" * 60)
 
     generate_bindings(output_file)
+    write_if_changed(hash_file, fingerprint(outputs))
 
     print("\n" + "=" * 60)
     print("✓ Generation complete!")
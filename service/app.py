@@ -4,43 +4,100 @@ FastAPI-based web service wrapping the Zoom Rooms C++ SDK
 """
 
 import asyncio
+import inspect
+import json
 import logging
-from typing import Dict, Optional
+import os
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Union
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import msgspec
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
 
-# Import the C++ SDK bindings
+# orjson serializes event dicts several times faster than the stdlib; optional
 try:
-    import zrc_sdk
+    from orjson import dumps as json_dumps, loads as json_loads
 except ImportError:
-    print("ERROR: zrc_sdk module not found. Run '../build.sh' first.")
-    raise
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    json_loads = json.loads
+
+# msgpack frames for clients that negotiate the "msgpack" subprotocol; optional
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
-# Configure logging
+# Redis pub/sub relays events between workers when ZRC_EVENT_BUS_URL is set; optional
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# Configure logging; LOG_LEVEL=WARNING skips the per-request INFO logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Import the C++ SDK bindings
+try:
+    import zrc_sdk
+except ImportError:
+    logger.error("zrc_sdk module not found. Run '../build.sh' first.")
+    raise
+
+# Success code as a plain int: comparing ints skips the enum attribute lookup
+# and the binding-level __eq__ on every request
+_ERR_SUCCESS = int(zrc_sdk.ZRCSDKERR_SUCCESS)
+
+# Enum values used on request and callback paths, resolved once at import
+_CONNECTED = zrc_sdk.ConnectionStateConnected
+_EXIT_LEAVE = zrc_sdk.ExitMeetingCmdLeave
+
 
-# ===== Pydantic Models =====
+# ===== Request Models =====
 
-class PairRoomRequest(BaseModel):
+# msgspec Structs decode and validate the JSON body in one pass, without the
+# intermediate dict and model instance FastAPI + pydantic would build
+
+class PairRoomRequest(msgspec.Struct):
     activation_code: str
 
 
-class JoinMeetingRequest(BaseModel):
+class JoinMeetingRequest(msgspec.Struct):
     meeting_number: str
     password: Optional[str] = ""
 
 
-class RoomStatus(BaseModel):
-    room_id: str
-    paired: bool
-    connection_state: Optional[str] = None
+def json_body(cls):
+    """Dependency that decodes the request body into the Struct ``cls``
+
+    Malformed or invalid bodies are rejected with 422, as FastAPI does for
+    its own models.
+    """
+    decoder = msgspec.json.Decoder(cls)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+    return Depends(decode)
+
+
+def json_body_schema(cls) -> dict:
+    """openapi_extra documenting a Struct request body in /docs"""
+    _, components = msgspec.json.schema_components([cls])
+    return {"requestBody": {"required": True, "content": {
+        "application/json": {"schema": components[cls.__name__]}
+    }}}
 
 
 # ===== SDK Sink Implementation =====
@@ -48,6 +105,13 @@ class RoomStatus(BaseModel):
 class SDKSinkImpl:
     """Simple SDK sink with default values"""
 
+    def __init__(self):
+        # SDK stores paired room data in this directory
+        # CRITICAL: Contains third_zrc_data.db with room credentials and tokens
+        # This MUST be persisted across container restarts
+        self.data_dir = os.path.expanduser("~/.zoom/data")
+        os.makedirs(self.data_dir, exist_ok=True)
+
     def OnGetDeviceManufacturer(self) -> str:
         return "ZoomRoomsWrapper"
 
@@ -79,174 +143,478 @@ class SDKSinkImpl:
         return "support@example.com"
 
     def OnGetAppContentDirPath(self) -> str:
-        import os
-        # SDK stores paired room data in this directory
-        # CRITICAL: Contains third_zrc_data.db with room credentials and tokens
-        # This MUST be persisted across container restarts
-        data_dir = os.path.expanduser("~/.zoom/data")
-        os.makedirs(data_dir, exist_ok=True)
-        return data_dir
+        return self.data_dir
 
 
 # ===== Callback Sinks for Events =====
 
-class ZoomRoomsServiceSink:
-    """Callback sink for room service events"""
+# Signatures of RoomManager.broadcast_event and has_subscribers, handed to
+# each sink
+Broadcast = Callable[[str, dict], None]
+Subscribed = Callable[[str], bool]
 
-    def __init__(self, room_id: str):
+# SDK callbacks may arrive on SDK-owned threads, so sinks never touch asyncio
+# objects directly: future results are marshalled onto the service loop and
+# broadcast_event() is thread-safe. Their log calls use %-style arguments so
+# nothing (including enum str()) is formatted when the level is filtered out,
+# and events are only built when someone can receive them.
+
+
+def _resolve(future: asyncio.Future, result) -> None:
+    """Complete a sink's one-shot future, unless it already completed or timed out"""
+    if not future.done():
+        future.set_result(result)
+
+
+class RoomSink:
+    """Callback sink for one room's room, pre-meeting and meeting service events
+
+    The SDK callbacks carry no room context, so each room needs its own sink;
+    the binding dispatches by method name, so the same object is registered
+    with all three services.
+    """
+
+    __slots__ = ("room_id", "broadcast", "subscribed", "loop", "pair_result", "pair_future",
+                 "connection_state", "connected_future")
+
+    def __init__(self, room_id: str, broadcast: Broadcast, subscribed: Subscribed,
+                 loop: asyncio.AbstractEventLoop):
         self.room_id = room_id
+        self.broadcast = broadcast
+        self.subscribed = subscribed
+        self.loop = loop
         self.pair_result: Optional[int] = None
-        self.pair_event = asyncio.Event()
+        # One-shot signals, created on the loop by pair_room for each attempt.
+        # The sink itself may be built on the SDK thread, so it starts without.
+        self.pair_future: Optional[asyncio.Future] = None
+        self.connection_state = None
+        self.connected_future: Optional[asyncio.Future] = None
+
+    # --- IZoomRoomsServiceSink ---
 
     def OnPairRoomResult(self, result: int):
         """Called when pairing completes (success or failure)"""
-        logger.info(f"[{self.room_id}] OnPairRoomResult: {result}")
+        logger.info("[%s] OnPairRoomResult: %s", self.room_id, result)
         self.pair_result = result
-        self.pair_event.set()
+        future = self.pair_future
+        if future is not None:
+            self.loop.call_soon_threadsafe(_resolve, future, result)
+        if self.subscribed(self.room_id):
+            self.broadcast(self.room_id, {"event": "OnPairRoomResult", "result": result})
 
-    def OnRoomUnpairedReason(self, reason: int):
+    def OnRoomUnpairedReason(self, reason):
         """Called when room is unpaired"""
-        logger.warning(f"[{self.room_id}] Room unpaired, reason: {reason}")
-
+        logger.warning("[%s] Room unpaired, reason: %s", self.room_id, reason)
+        if self.subscribed(self.room_id):
+            self.broadcast(self.room_id, {"event": "OnRoomUnpairedReason", "reason": reason.name})
 
-class PreMeetingServiceSink:
-    """Callback sink for pre-meeting service events"""
-
-    def __init__(self, room_id: str):
-        self.room_id = room_id
-        self.connection_state = None
-        self.connected_event = asyncio.Event()
+    # --- IPreMeetingServiceSink ---
 
     def OnZRConnectionStateChanged(self, state):
         """Called when connection state changes"""
-        logger.info(f"[{self.room_id}] Connection state changed: {state}")
+        logger.info("[%s] Connection state changed: %s", self.room_id, state)
         self.connection_state = state
-        if state == zrc_sdk.ConnectionStateConnected:
-            self.connected_event.set()
+        future = self.connected_future
+        if state == _CONNECTED and future is not None:
+            self.loop.call_soon_threadsafe(_resolve, future, state)
+        if self.subscribed(self.room_id):
+            self.broadcast(self.room_id, {"event": "OnZRConnectionStateChanged", "state": state.name})
 
     def OnShutdownOSNot(self, restart_os: bool):
         """Called when shutdown notification received"""
-        logger.info(f"[{self.room_id}] Shutdown OS notification: restart={restart_os}")
+        logger.info("[%s] Shutdown OS notification: restart=%s", self.room_id, restart_os)
+
+    # --- IMeetingServiceSink ---
+
+    def OnUpdateMeetingStatus(self, status):
+        """Called when the room's meeting status changes"""
+        logger.info("[%s] Meeting status changed: %s", self.room_id, status)
+        if self.subscribed(self.room_id):
+            self.broadcast(self.room_id, {"event": "OnUpdateMeetingStatus", "status": status.name})
+
+    def OnConfReadyNotification(self):
+        """Called when the meeting the room started or joined is ready"""
+        logger.info("[%s] Conference ready", self.room_id)
+        if self.subscribed(self.room_id):
+            self.broadcast(self.room_id, {"event": "OnConfReadyNotification"})
+
+    def OnExitMeetingNotification(self):
+        """Called when the room has left its meeting"""
+        logger.info("[%s] Exited meeting", self.room_id)
+        if self.subscribed(self.room_id):
+            self.broadcast(self.room_id, {"event": "OnExitMeetingNotification"})
 
 
 # ===== Room Manager =====
 
+# HeartBeat cadence (ms) while any room is registered, and while none is
+HEARTBEAT_INTERVAL_MS = 150
+HEARTBEAT_IDLE_INTERVAL_MS = 1000
+
+# e.g. redis://localhost:6379/0; unset keeps event fanout in-process
+EVENT_BUS_URL = os.environ.get("ZRC_EVENT_BUS_URL")
+EVENT_CHANNEL_PREFIX = "room:"
+
+# How long a room's sender collects events before sending batch subscribers
+# one {"events": [...]} frame
+EVENT_COALESCE_WINDOW = 0.015
+
+# Token bucket for messages a client sends on its events socket (which are
+# ignored): sustained rate per second and burst size before it is closed
+CLIENT_MESSAGE_RATE = 5.0
+CLIENT_MESSAGE_BURST = 20
+
+# WebSocket subprotocol a client offers to receive msgpack instead of JSON
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+
+def _encode_frames(payloads: List[bytes], encoding: str, batch: bool) -> list:
+    """Frames for one subscriber mode from a room's serialized JSON events
+
+    ``encoding`` is "text" (str frames), "binary" (the JSON bytes as-is) or
+    "msgpack"; ``batch`` wraps all the events in one {"events": [...]} frame.
+    """
+    if encoding == "msgpack":
+        events = [json_loads(payload) for payload in payloads]
+        if batch:
+            return [msgpack.packb({"events": events})]
+        return [msgpack.packb(event) for event in events]
+    if batch:
+        # Payloads are JSON already, so join rather than re-encode
+        payloads = [b'{"events":[' + b",".join(payloads) + b"]}"]
+    if encoding == "text":
+        return [payload.decode() for payload in payloads]
+    return payloads
+
+
 class RoomManager:
     """Manages multiple Zoom Room connections"""
 
     def __init__(self):
         self.sdk = None
         self.rooms: Dict[str, any] = {}  # room_id -> IZoomRoomsService
-        self.room_sinks: Dict[str, ZoomRoomsServiceSink] = {}
-        self.premeeting_sinks: Dict[str, PreMeetingServiceSink] = {}
-        self.heartbeat_task = None
+        self.room_sinks: Dict[str, RoomSink] = {}
+        # Held by pair_room for the whole pair-and-connect wait, per room
+        self.room_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Per-room service handles, fetched once so handlers skip the getters
+        self.premeeting_services: Dict[str, any] = {}  # room_id -> IPreMeetingService
+        self.meeting_services: Dict[str, any] = {}  # room_id -> IMeetingService
         self.sdk_sink = SDKSinkImpl()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # Single thread that runs blocking SDK calls off the event loop; the
+        # binding releases the GIL during each call and serializes it with
+        # HeartBeat ticks under its own SDK lock
+        self._sdk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zrc-sdk")
+        # Event WebSockets per room, fed by one sender task per room
+        self.websockets: Dict[str, Set[WebSocket]] = defaultdict(set)
+        # Subscribers that asked for binary frames (raw orjson bytes)
+        self._binary_websockets: Set[WebSocket] = set()
+        # Subscribers that asked for coalesced {"events": [...]} frames
+        self._batch_websockets: Set[WebSocket] = set()
+        # Subscribers that negotiated msgpack frames
+        self._msgpack_websockets: Set[WebSocket] = set()
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._senders: Dict[str, asyncio.Task] = {}
+        # Events broadcast from SDK threads, waiting for the loop to pick them up
+        self._pending: deque = deque()
+        self._drain_scheduled = False
+        # Redis client and (room_id, payload) outbox, when the event bus is on
+        self._bus = None
+        self._outbox: Optional[asyncio.Queue] = None
+        self._bus_tasks: List[asyncio.Task] = []
 
     def initialize(self):
         """Initialize the SDK"""
         logger.info("Initializing Zoom Rooms SDK...")
+        # SDK callbacks hand work back to this loop; see broadcast_event()
+        self.loop = asyncio.get_running_loop()
         self.sdk = zrc_sdk.IZRCSDK.GetInstance()
 
         # Register SDK sink using the helper function
         result = zrc_sdk.RegisterSDKSink(self.sdk, self.sdk_sink)
-        logger.info(f"SDK sink registered: {result}")
+        logger.info("SDK sink registered: %s", result)
 
         # Query and restore previously paired rooms
         logger.info("Querying for previously paired rooms...")
-        logger.info(f"Data directory: {self.sdk_sink.OnGetAppContentDirPath()}")
-        room_infos = []
-        result = self.sdk.QueryAllZoomRoomsServices(room_infos)
+        logger.info("Data directory: %s", self.sdk_sink.data_dir)
+        # (result, [(room_id, room_name, display_name, address, can_retry, worker)])
+        result, room_infos = self.sdk.QueryAllZoomRoomsServices()
+        logger.info("QueryAllZoomRoomsServices result: %s", result)
 
-        logger.info(f"QueryAllZoomRoomsServices result: {result} (type: {type(result)})")
-        logger.info(f"room_infos length: {len(room_infos)}")
-        logger.info(f"room_infos type: {type(room_infos)}")
-
-        if result == zrc_sdk.ZRCSDKERR_SUCCESS:
+        if int(result) == _ERR_SUCCESS:
             if room_infos:
-                logger.info(f"Found {len(room_infos)} previously paired room(s)")
-                for room_info in room_infos:
-                    logger.info(f"  - Room: {room_info.roomID} ({room_info.roomName})")
-                    logger.info(f"    Display: {room_info.displayName}")
-                    logger.info(f"    Address: {room_info.roomAddress}")
-                    logger.info(f"    Can retry: {room_info.canRetryToPair}")
-                    logger.info(f"    Worker present: {room_info.worker is not None}")
+                logger.info("Found %s previously paired room(s)", len(room_infos))
+                for room_id, room_name, display_name, address, can_retry, worker in room_infos:
+                    # Five records per room; skip them all when INFO is off
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("  - Room: %s (%s)", room_id, room_name)
+                        logger.info("    Display: %s", display_name)
+                        logger.info("    Address: %s", address)
+                        logger.info("    Can retry: %s", can_retry)
+                        logger.info("    Worker present: %s", worker is not None)
 
                     # Get the service for this room
-                    if room_info.worker:
-                        self.rooms[room_info.roomID] = room_info.worker
-                        logger.info(f"✓ Restored room service for: {room_info.roomID}")
+                    if worker:
+                        self._add_room(room_id, worker)
+                        logger.info("✓ Restored room service for: %s", room_id)
                     else:
-                        logger.warning(f"  Room {room_info.roomID} has no worker, skipping")
+                        logger.warning("  Room %s has no worker, skipping", room_id)
             else:
                 logger.info("No previously paired rooms found (empty list)")
         else:
-            logger.warning(f"QueryAllZoomRoomsServices returned error: {result}")
+            logger.warning("QueryAllZoomRoomsServices returned error: %s", result)
 
         logger.info("✓ SDK initialized successfully")
 
-    async def start_heartbeat(self):
-        """Start the SDK HeartBeat timer (required on Linux)"""
-        async def heartbeat_loop():
-            logger.info("Starting SDK HeartBeat loop (150ms interval)...")
-            while True:
-                try:
-                    if self.sdk:
-                        self.sdk.HeartBeat()
-                    await asyncio.sleep(0.15)  # 150ms interval
-                except Exception as e:
-                    logger.error(f"HeartBeat error: {e}")
-                    break
-
-        self.heartbeat_task = asyncio.create_task(heartbeat_loop())
-
-    async def stop_heartbeat(self):
-        """Stop the HeartBeat timer"""
-        if self.heartbeat_task:
-            self.heartbeat_task.cancel()
-            try:
-                await self.heartbeat_task
-            except asyncio.CancelledError:
-                pass
+    def start_heartbeat(self):
+        """Start the SDK HeartBeat pump (required on Linux)
+
+        HeartBeat runs on a C++ thread in the binding, on absolute deadlines,
+        so the event loop never schedules it. It ticks every
+        HEARTBEAT_IDLE_INTERVAL_MS until the first room is registered.
+        """
+        interval = HEARTBEAT_INTERVAL_MS if self.rooms else HEARTBEAT_IDLE_INTERVAL_MS
+        logger.info("Starting SDK HeartBeat thread (%sms interval)...", interval)
+        zrc_sdk.StartHeartBeatThread(self.sdk, interval)
+
+    def stop_heartbeat(self):
+        """Stop the HeartBeat pump"""
+        zrc_sdk.StopHeartBeatThread()
 
     def create_room_service(self, room_id: str):
         """Create a new room service instance with callbacks"""
         if room_id in self.rooms:
             return self.rooms[room_id]
 
-        logger.info(f"Creating service for room: {room_id}")
+        logger.info("Creating service for room: %s", room_id)
         room_service = self.sdk.CreateZoomRoomsService(room_id)
 
-        # Register room service callback sink
-        room_sink = ZoomRoomsServiceSink(room_id)
+        # One sink per room, registered with the room, pre-meeting and meeting services
+        room_sink = RoomSink(room_id, self.broadcast_event, self.has_subscribers, self.loop)
+        registered = True
         result = room_service.RegisterSink(room_sink)
-        if result == zrc_sdk.ZRCSDKERR_SUCCESS:
-            self.room_sinks[room_id] = room_sink
-            logger.info(f"✓ Registered room service sink for: {room_id}")
+        if int(result) == _ERR_SUCCESS:
+            logger.info("✓ Registered room service sink for: %s", room_id)
         else:
-            logger.error(f"Failed to register room service sink: {result}")
-
-        # Register pre-meeting service callback sink
-        premeeting = room_service.GetPreMeetingService()
-        premeeting_sink = PreMeetingServiceSink(room_id)
-        result = premeeting.RegisterSink(premeeting_sink)
-        if result == zrc_sdk.ZRCSDKERR_SUCCESS:
-            self.premeeting_sinks[room_id] = premeeting_sink
-            logger.info(f"✓ Registered pre-meeting sink for: {room_id}")
+            registered = False
+            logger.error("Failed to register room service sink: %s", result)
+
+        result = room_service.GetPreMeetingService().RegisterSink(room_sink)
+        if int(result) == _ERR_SUCCESS:
+            logger.info("✓ Registered pre-meeting sink for: %s", room_id)
         else:
-            logger.error(f"Failed to register pre-meeting sink: {result}")
+            registered = False
+            logger.error("Failed to register pre-meeting sink: %s", result)
 
-        self.rooms[room_id] = room_service
+        result = room_service.GetMeetingService().RegisterSink(room_sink)
+        if int(result) == _ERR_SUCCESS:
+            logger.info("✓ Registered meeting sink for: %s", room_id)
+        else:
+            registered = False
+            logger.error("Failed to register meeting sink: %s", result)
+
+        if registered:
+            self.room_sinks[room_id] = room_sink
+
+        self._add_room(room_id, room_service)
         return room_service
 
+    def _add_room(self, room_id: str, room_service):
+        """Track a room service along with its sub-service handles"""
+        if not self.rooms:
+            zrc_sdk.SetHeartBeatInterval(HEARTBEAT_INTERVAL_MS)
+        self.rooms[room_id] = room_service
+        self.premeeting_services[room_id] = room_service.GetPreMeetingService()
+        self.meeting_services[room_id] = room_service.GetMeetingService()
+
     def get_room_service(self, room_id: str):
         """Get existing room service or None"""
         return self.rooms.get(room_id)
 
+    async def _call(self, fn, *args):
+        """Run a blocking SDK call on the SDK thread and await its result
+
+        The binding drops the GIL for the length of each SDK call, so the
+        event loop keeps running meanwhile. Calls are serialized against each
+        other and against the HeartBeat pump by the binding's SDK lock. Only
+        hand it bound SDK methods: Python code would hold the GIL on the SDK
+        thread and stall the loop anyway.
+        """
+        return await self.loop.run_in_executor(self._sdk_executor, fn, *args)
+
+    def add_websocket(self, room_id: str, websocket: WebSocket, binary: bool = False,
+                      batch: bool = False, use_msgpack: bool = False):
+        """Subscribe a WebSocket to a room's events"""
+        self.websockets[room_id].add(websocket)
+        if binary:
+            self._binary_websockets.add(websocket)
+        if batch:
+            self._batch_websockets.add(websocket)
+        if use_msgpack:
+            self._msgpack_websockets.add(websocket)
+        if room_id not in self._senders:
+            self._queues[room_id] = asyncio.Queue()
+            self._senders[room_id] = asyncio.create_task(self._send_events(room_id))
+
+    def remove_websocket(self, room_id: str, websocket: WebSocket):
+        """Unsubscribe a WebSocket from a room's events"""
+        self.websockets[room_id].discard(websocket)
+        self._binary_websockets.discard(websocket)
+        self._batch_websockets.discard(websocket)
+        self._msgpack_websockets.discard(websocket)
+
+    def has_subscribers(self, room_id: str) -> bool:
+        """Whether an event for the room would reach anyone
+
+        Always true with the event bus on, since other workers may have
+        subscribers. Safe to call from any thread.
+        """
+        # .get() so a miss doesn't insert into the defaultdict
+        return self._bus is not None or bool(self.websockets.get(room_id))
+
+    def broadcast_event(self, room_id: str, event: dict):
+        """Queue an event for every WebSocket subscribed to the room
+
+        Safe to call from any thread. Events land in a shared deque and the
+        loop is woken only when no drain is already scheduled, so a burst of
+        callbacks from one HeartBeat costs a single wakeup.
+        """
+        self._pending.append((room_id, event))
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self.loop.call_soon_threadsafe(self._drain_pending)
+
+    def _drain_pending(self):
+        """Move broadcast events onto their rooms' queues (runs on the loop)"""
+        # Clear the flag before draining: an event appended after this point
+        # either gets drained below or schedules the next drain
+        self._drain_scheduled = False
+        pending = self._pending
+        queues = self._queues
+        outbox = self._outbox
+        while pending:
+            room_id, event = pending.popleft()
+            if outbox is not None:
+                # Comes back to every worker, this one included, via _relay_events
+                outbox.put_nowait((room_id, json_dumps(event)))
+            else:
+                queue = queues.get(room_id)
+                if queue is not None:
+                    queue.put_nowait(json_dumps(event))
+
+    async def _send_events(self, room_id: str):
+        """Deliver a room's queued events to its subscribers
+
+        Queued events are already-serialized JSON bytes. Frames are encoded
+        once per subscriber mode (see _encode_frames) and shared by every
+        socket in that mode. While a batch subscriber is connected, events
+        arriving within EVENT_COALESCE_WINDOW are sent together; everyone else
+        still gets one frame per event. Sockets that fail to send are dropped.
+        """
+        queue = self._queues[room_id]
+        websockets = self.websockets[room_id]
+        binary_websockets = self._binary_websockets
+        batch_websockets = self._batch_websockets
+        msgpack_websockets = self._msgpack_websockets
+        while True:
+            payloads = [await queue.get()]
+            if not batch_websockets.isdisjoint(websockets):
+                await asyncio.sleep(EVENT_COALESCE_WINDOW)
+                while not queue.empty():
+                    payloads.append(queue.get_nowait())
+            frames_by_mode = {}
+            for websocket in list(websockets):
+                # Skip sockets already known to be closed instead of letting
+                # each send raise; the try below only catches mid-send drops
+                if (websocket.client_state is not WebSocketState.CONNECTED
+                        or websocket.application_state is not WebSocketState.CONNECTED):
+                    self.remove_websocket(room_id, websocket)
+                    continue
+                if websocket in msgpack_websockets:
+                    encoding = "msgpack"
+                elif websocket in binary_websockets:
+                    encoding = "binary"
+                else:
+                    encoding = "text"
+                mode = (encoding, websocket in batch_websockets)
+                frames = frames_by_mode.get(mode)
+                if frames is None:
+                    frames = frames_by_mode[mode] = _encode_frames(payloads, *mode)
+                try:
+                    if encoding == "text":
+                        for frame in frames:
+                            await websocket.send_text(frame)
+                    else:
+                        for frame in frames:
+                            await websocket.send_bytes(frame)
+                except Exception:
+                    self.remove_websocket(room_id, websocket)
+
+    async def stop_event_senders(self):
+        """Cancel the per-room event sender tasks"""
+        for task in self._senders.values():
+            task.cancel()
+        await asyncio.gather(*self._senders.values(), return_exceptions=True)
+        self._senders.clear()
+        self._queues.clear()
+
+    async def start_event_bus(self, url: str):
+        """Relay room events through Redis pub/sub so every worker sees them
+
+        Events are published on ``room:{room_id}``. Each worker subscribes to
+        all rooms and feeds its own WebSocket senders from the channel, so a
+        subscriber gets a room's events whichever worker it connected to.
+        """
+        if aioredis is None:
+            raise RuntimeError("ZRC_EVENT_BUS_URL is set but the redis package is not installed")
+        logger.info("Relaying room events through %s", url)
+        self._bus = aioredis.from_url(url)
+        pubsub = self._bus.pubsub()
+        await pubsub.psubscribe(EVENT_CHANNEL_PREFIX + "*")
+        self._outbox = asyncio.Queue()
+        self._bus_tasks = [
+            asyncio.create_task(self._publish_events()),
+            asyncio.create_task(self._relay_events(pubsub)),
+        ]
+
+    async def _publish_events(self):
+        """Publish this worker's events to their room channels, in order"""
+        outbox = self._outbox
+        while True:
+            room_id, payload = await outbox.get()
+            try:
+                await self._bus.publish(EVENT_CHANNEL_PREFIX + room_id, payload)
+            except Exception as e:
+                logger.error("Event bus publish failed for %s: %s", room_id, e)
+
+    async def _relay_events(self, pubsub):
+        """Feed events from the bus to this worker's room senders"""
+        prefix_len = len(EVENT_CHANNEL_PREFIX)
+        async with pubsub:
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                queue = self._queues.get(message["channel"][prefix_len:].decode())
+                if queue is not None:
+                    queue.put_nowait(message["data"])
+
+    async def stop_event_bus(self):
+        """Stop relaying events and close the Redis connection"""
+        for task in self._bus_tasks:
+            task.cancel()
+        await asyncio.gather(*self._bus_tasks, return_exceptions=True)
+        self._bus_tasks.clear()
+        self._outbox = None
+        if self._bus is not None:
+            await self._bus.aclose()
+            self._bus = None
+
     def shutdown(self):
         """Clean up SDK resources"""
         logger.info("Shutting down SDK...")
         # Don't call DestroyInstance - it can cause crashes
         # The SDK will clean up on process exit
+        self._sdk_executor.shutdown(wait=True)
         self.sdk = None
         logger.info("✓ SDK shutdown complete")
 
@@ -262,12 +630,16 @@ async def lifespan(app: FastAPI):
     # Startup
     try:
         room_manager.initialize()
-        await room_manager.start_heartbeat()
+        if EVENT_BUS_URL:
+            await room_manager.start_event_bus(EVENT_BUS_URL)
+        room_manager.start_heartbeat()
         logger.info("✓ Microservice started successfully")
         yield
     finally:
         # Shutdown
-        await room_manager.stop_heartbeat()
+        room_manager.stop_heartbeat()
+        await room_manager.stop_event_bus()
+        await room_manager.stop_event_senders()
         room_manager.shutdown()
         logger.info("✓ Microservice stopped")
 
@@ -282,52 +654,91 @@ app = FastAPI(
 
 # ===== API Endpoints =====
 
-@app.get("/")
-async def root():
-    return {
+def json_response(content: Union[dict, list]) -> Response:
+    """Serialize a handler's result with json_dumps and return it as-is
+
+    A Response passes straight through FastAPI, skipping the jsonable_encoder
+    walk and stdlib json encoding a returned dict would get.
+    """
+    return Response(content=json_dumps(content), media_type="application/json")
+
+
+def _command_result(room_id: str, result) -> dict:
+    """Body shared by every room command: the SDK result and whether it succeeded"""
+    code = int(result)
+    return {"room_id": room_id, "result": code, "success": code == _ERR_SUCCESS}
+
+
+# "/" and "/health" are polled constantly and only change with the room count,
+# so their bodies are serialized once per distinct state
+
+@lru_cache(maxsize=64)
+def _root_body(rooms: int) -> bytes:
+    return json_dumps({
         "service": "Zoom Rooms SDK Microservice",
         "version": "1.0.0",
         "status": "running",
-        "rooms": len(room_manager.rooms)
-    }
+        "rooms": rooms
+    })
+
+
+@lru_cache(maxsize=64)
+def _health_body(active_rooms: int, sdk_initialized: bool) -> bytes:
+    return json_dumps({
+        "status": "healthy",
+        "sdk_initialized": sdk_initialized,
+        "active_rooms": active_rooms
+    })
+
+
+@app.get("/")
+async def root():
+    return Response(content=_root_body(len(room_manager.rooms)), media_type="application/json")
 
 
-@app.get("/api/rooms")
-async def list_rooms():
+# The polled read endpoints below are plain Starlette routes, like /rpc:
+# they take the Request directly and skip FastAPI's parameter resolution
+
+async def list_rooms(request: Request) -> Response:
     """List all room services"""
-    rooms = []
-    for room_id in room_manager.rooms.keys():
-        try:
-            room_service = room_manager.rooms[room_id]
-            premeeting = room_service.GetPreMeetingService()
-            # GetConnectionState returns (result, state) tuple
-            result, state = premeeting.GetConnectionState()
-
-            if result == zrc_sdk.ZRCSDKERR_SUCCESS:
-                rooms.append(RoomStatus(
-                    room_id=room_id,
-                    paired=True,
-                    connection_state=str(state)
-                ))
-            else:
-                rooms.append(RoomStatus(
-                    room_id=room_id,
-                    paired=True,
-                    connection_state="error"
-                ))
-        except Exception as e:
-            logger.error(f"Error getting room {room_id} status: {e}")
-            rooms.append(RoomStatus(
-                room_id=room_id,
-                paired=True,
-                connection_state="unknown"
-            ))
-
-    return {"rooms": rooms}
-
-
-@app.post("/api/rooms/{room_id}/pair")
-async def pair_room(room_id: str, request: PairRoomRequest):
+    # Snapshot: rooms may be added on the SDK thread while we await
+    rooms = list(room_manager.premeeting_services.items())
+    room_ids = [room_id for room_id, _ in rooms]
+    premeeting_services = [premeeting for _, premeeting in rooms]
+    # Every room's state in one SDK-thread hop and one binding call; each
+    # entry is (result, state), or None if that room's query failed
+    try:
+        states = await room_manager._call(zrc_sdk.GetConnectionStates, premeeting_services)
+        connection_states = [
+            "unknown" if status is None
+            else str(status[1]) if int(status[0]) == _ERR_SUCCESS
+            else "error"
+            for status in states
+        ]
+    except Exception as e:
+        logger.error("Error getting room connection states: %s", e)
+        connection_states = ["unknown"] * len(room_ids)
+    # Plain dicts, no per-room model construction or validation
+    return json_response({"rooms": [
+        {"room_id": room_id, "paired": True, "connection_state": connection_state}
+        for room_id, connection_state in zip(room_ids, connection_states)
+    ]})
+
+
+app.add_route("/api/rooms", list_rooms, methods=["GET"])
+
+
+# OnPairRoomResult codes with a friendlier explanation than the raw number
+_PAIR_ERROR_MESSAGES = {
+    30055016: "Invalid activation code",
+    100: "Failed to connect to room controller. Ensure the room controller is network-accessible.",
+    101: "Room cannot verify connection",
+    102: "Timeout waiting for room's verify response"
+}
+
+
+@app.post("/api/rooms/{room_id}/pair", openapi_extra=json_body_schema(PairRoomRequest))
+async def pair_room(room_id: str, request: PairRoomRequest = json_body(PairRoomRequest)):
     """
     Pair a Zoom Room with activation code and wait for full connection.
 
@@ -338,100 +749,101 @@ async def pair_room(room_id: str, request: PairRoomRequest):
     Only returns success when room is fully connected and persisted to database.
     """
     try:
-        # Create or get room service
+        # Create or get room service. Runs on the loop: the sink it builds
+        # belongs to the loop, and its SDK calls are quick
         room_service = room_manager.create_room_service(room_id)
 
-        # Get the callback sinks
+        # Get the room's callback sink
         room_sink = room_manager.room_sinks.get(room_id)
-        premeeting_sink = room_manager.premeeting_sinks.get(room_id)
 
-        if not room_sink or not premeeting_sink:
+        if not room_sink:
             raise HTTPException(status_code=500, detail="Failed to register callbacks")
 
-        # Reset events in case of retry
-        room_sink.pair_event.clear()
-        premeeting_sink.connected_event.clear()
-
-        # Start pairing process
-        logger.info(f"[{room_id}] Starting pairing with activation code...")
-        result = room_service.PairRoomWithActivationCode(request.activation_code)
-
-        if result != zrc_sdk.ZRCSDKERR_SUCCESS:
-            raise HTTPException(
-                status_code=500,
-                detail={
-                    "room_id": room_id,
-                    "result": int(result),
-                    "success": False,
-                    "message": "Failed to initiate pairing"
-                }
+        # Serialize pair attempts on this room so a concurrent request can't
+        # clear or consume the events another one is waiting on
+        async with room_manager.room_locks[room_id]:
+            # Fresh signals for this attempt
+            room_sink.pair_future = room_manager.loop.create_future()
+            room_sink.connected_future = room_manager.loop.create_future()
+
+            # Start pairing process
+            logger.info("[%s] Starting pairing with activation code...", room_id)
+            result = await room_manager._call(
+                room_service.PairRoomWithActivationCode, request.activation_code
             )
 
-        # Wait for OnPairRoomResult callback (30 second timeout)
-        logger.info(f"[{room_id}] Waiting for pair result callback...")
-        try:
-            await asyncio.wait_for(room_sink.pair_event.wait(), timeout=30.0)
-        except asyncio.TimeoutError:
-            raise HTTPException(
-                status_code=504,
-                detail={
-                    "room_id": room_id,
-                    "result": -1,
-                    "success": False,
-                    "message": "Timeout waiting for pairing result"
-                }
-            )
-
-        # Check pairing result
-        if room_sink.pair_result != 0:
-            error_messages = {
-                30055016: "Invalid activation code",
-                100: "Failed to connect to room controller. Ensure the room controller is network-accessible.",
-                101: "Room cannot verify connection",
-                102: "Timeout waiting for room's verify response"
-            }
-            message = error_messages.get(room_sink.pair_result, f"Pairing failed with code {room_sink.pair_result}")
-
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "room_id": room_id,
-                    "result": room_sink.pair_result,
-                    "success": False,
-                    "message": message
-                }
-            )
-
-        # Wait for ConnectionStateConnected (60 second timeout)
-        logger.info(f"[{room_id}] Pairing successful, waiting for connection...")
-        try:
-            await asyncio.wait_for(premeeting_sink.connected_event.wait(), timeout=60.0)
-        except asyncio.TimeoutError:
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "room_id": room_id,
-                    "result": 0,
-                    "success": False,
-                    "message": "Pairing succeeded but timeout waiting for connection. Ensure the room controller is network-accessible."
-                }
-            )
-
-        # Success! Room is now connected and persisted
-        logger.info(f"[{room_id}] ✓ Room fully connected and persisted")
-        return {
-            "room_id": room_id,
-            "result": 0,
-            "success": True,
-            "message": "Room successfully paired and connected",
-            "connection_state": str(premeeting_sink.connection_state)
-        }
+            if int(result) != _ERR_SUCCESS:
+                raise HTTPException(
+                    status_code=500,
+                    detail={
+                        "room_id": room_id,
+                        "result": int(result),
+                        "success": False,
+                        "message": "Failed to initiate pairing"
+                    }
+                )
+
+            # Wait for OnPairRoomResult callback (30 second timeout)
+            logger.info("[%s] Waiting for pair result callback...", room_id)
+            try:
+                await asyncio.wait_for(room_sink.pair_future, timeout=30.0)
+            except asyncio.TimeoutError:
+                raise HTTPException(
+                    status_code=504,
+                    detail={
+                        "room_id": room_id,
+                        "result": -1,
+                        "success": False,
+                        "message": "Timeout waiting for pairing result"
+                    }
+                )
+
+            # Check pairing result
+            if room_sink.pair_result != 0:
+                message = _PAIR_ERROR_MESSAGES.get(
+                    room_sink.pair_result, f"Pairing failed with code {room_sink.pair_result}"
+                )
+
+                raise HTTPException(
+                    status_code=400,
+                    detail={
+                        "room_id": room_id,
+                        "result": room_sink.pair_result,
+                        "success": False,
+                        "message": message
+                    }
+                )
+
+            # Wait for ConnectionStateConnected (60 second timeout)
+            logger.info("[%s] Pairing successful, waiting for connection...", room_id)
+            try:
+                await asyncio.wait_for(room_sink.connected_future, timeout=60.0)
+            except asyncio.TimeoutError:
+                raise HTTPException(
+                    status_code=503,
+                    detail={
+                        "room_id": room_id,
+                        "result": 0,
+                        "success": False,
+                        "message": "Pairing succeeded but timeout waiting for connection. Ensure the room controller is network-accessible."
+                    }
+                )
+
+            # Success! Room is now connected and persisted
+            logger.info("[%s] ✓ Room fully connected and persisted", room_id)
+            return json_response({
+                "room_id": room_id,
+                "result": 0,
+                "success": True,
+                "message": "Room successfully paired and connected",
+                "connection_state": str(room_sink.connection_state)
+            })
 
     except HTTPException:
         # Re-raise HTTPException as-is (don't wrap it)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error pairing room {room_id}: {e}")
+        logger.error("Unexpected error pairing room %s: %s", room_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -443,79 +855,71 @@ async def unpair_room(room_id: str):
         raise HTTPException(status_code=404, detail="Room not found")
 
     try:
-        result = room_service.UnpairRoom()
-        return {
-            "room_id": room_id,
-            "result": int(result),
-            "success": result == zrc_sdk.ZRCSDKERR_SUCCESS
-        }
+        result = await room_manager._call(room_service.UnpairRoom)
+        return json_response(_command_result(room_id, result))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/rooms/{room_id}/status")
-async def get_room_status(room_id: str):
+async def get_room_status(request: Request) -> Response:
     """Get room connection status"""
-    room_service = room_manager.get_room_service(room_id)
-    if not room_service:
+    room_id = request.path_params["room_id"]
+    premeeting = room_manager.premeeting_services.get(room_id)
+    if not premeeting:
         raise HTTPException(status_code=404, detail="Room not found")
 
     try:
-        premeeting = room_service.GetPreMeetingService()
         # GetConnectionState returns (result, state) tuple
-        result, state = premeeting.GetConnectionState()
+        result, state = await room_manager._call(premeeting.GetConnectionState)
 
-        if result != zrc_sdk.ZRCSDKERR_SUCCESS:
+        if int(result) != _ERR_SUCCESS:
             raise HTTPException(status_code=500, detail=f"Failed to get connection state: {result}")
 
-        return {
+        return json_response({
             "room_id": room_id,
             "connection_state": str(state),
-            "connected": state == zrc_sdk.ConnectionStateConnected
-        }
+            "connected": state == _CONNECTED
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+app.add_route("/api/rooms/{room_id}/status", get_room_status, methods=["GET"])
+
+
 @app.post("/api/rooms/{room_id}/meeting/start_instant")
 async def start_instant_meeting(room_id: str):
     """Start an instant meeting"""
-    room_service = room_manager.get_room_service(room_id)
-    if not room_service:
+    meeting_service = room_manager.meeting_services.get(room_id)
+    if not meeting_service:
         raise HTTPException(status_code=404, detail="Room not found")
 
     try:
-        meeting_service = room_service.GetMeetingService()
-        result = meeting_service.StartInstantMeeting()
+        result = await room_manager._call(meeting_service.StartInstantMeeting)
 
-        return {
-            "room_id": room_id,
-            "result": int(result),
-            "success": result == zrc_sdk.ZRCSDKERR_SUCCESS
-        }
+        return json_response(_command_result(room_id, result))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/rooms/{room_id}/meeting/join")
-async def join_meeting(room_id: str, request: JoinMeetingRequest):
+@app.post("/api/rooms/{room_id}/meeting/join", openapi_extra=json_body_schema(JoinMeetingRequest))
+async def join_meeting(room_id: str,
+                       request: JoinMeetingRequest = json_body(JoinMeetingRequest)):
     """Join a meeting by number"""
-    room_service = room_manager.get_room_service(room_id)
-    if not room_service:
+    meeting_service = room_manager.meeting_services.get(room_id)
+    if not meeting_service:
         raise HTTPException(status_code=404, detail="Room not found")
 
     try:
-        meeting_service = room_service.GetMeetingService()
-        result = meeting_service.JoinMeeting(
+        result = await room_manager._call(
+            meeting_service.JoinMeeting,
             request.meeting_number,
             request.password
         )
 
-        return {
-            "room_id": room_id,
-            "result": int(result),
-            "success": result == zrc_sdk.ZRCSDKERR_SUCCESS
-        }
+        return json_response(_command_result(room_id, result))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -523,33 +927,194 @@ async def join_meeting(room_id: str, request: JoinMeetingRequest):
 @app.post("/api/rooms/{room_id}/meeting/exit")
 async def exit_meeting(room_id: str):
     """Exit the current meeting"""
-    room_service = room_manager.get_room_service(room_id)
-    if not room_service:
+    meeting_service = room_manager.meeting_services.get(room_id)
+    if not meeting_service:
         raise HTTPException(status_code=404, detail="Room not found")
 
     try:
-        meeting_service = room_service.GetMeetingService()
-        result = meeting_service.ExitMeeting(zrc_sdk.ExitMeetingCmdLeave)
+        result = await room_manager._call(meeting_service.ExitMeeting, _EXIT_LEAVE)
 
-        return {
-            "room_id": room_id,
-            "result": int(result),
-            "success": result == zrc_sdk.ZRCSDKERR_SUCCESS
-        }
+        return json_response(_command_result(room_id, result))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ===== JSON-RPC =====
+
+# JSON-RPC 2.0 error codes; -32000..-32099 are left to the server
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_INTERNAL_ERROR = -32603
+RPC_ROOM_NOT_FOUND = -32001
+
+
+# Each RPC method takes its params by name, including room_id; the dispatcher
+# binds them and checks the room exists before calling
+
+async def _rpc_unpair_room(room_id: str) -> dict:
+    return _command_result(room_id, await room_manager._call(room_manager.rooms[room_id].UnpairRoom))
+
+
+async def _rpc_get_room_status(room_id: str) -> dict:
+    premeeting = room_manager.premeeting_services[room_id]
+    result, state = await room_manager._call(premeeting.GetConnectionState)
+    if int(result) != _ERR_SUCCESS:
+        raise RuntimeError(f"Failed to get connection state: {result}")
+    return {
+        "room_id": room_id,
+        "connection_state": str(state),
+        "connected": state == _CONNECTED
+    }
+
+
+async def _rpc_start_instant_meeting(room_id: str) -> dict:
+    meeting_service = room_manager.meeting_services[room_id]
+    return _command_result(room_id, await room_manager._call(meeting_service.StartInstantMeeting))
+
+
+async def _rpc_join_meeting(room_id: str, meeting_number: str, password: str = "") -> dict:
+    meeting_service = room_manager.meeting_services[room_id]
+    result = await room_manager._call(meeting_service.JoinMeeting, meeting_number, password)
+    return _command_result(room_id, result)
+
+
+async def _rpc_exit_meeting(room_id: str) -> dict:
+    meeting_service = room_manager.meeting_services[room_id]
+    result = await room_manager._call(meeting_service.ExitMeeting, _EXIT_LEAVE)
+    return _command_result(room_id, result)
+
+
+RPC_METHODS = {
+    "unpair_room": _rpc_unpair_room,
+    "get_room_status": _rpc_get_room_status,
+    "start_instant_meeting": _rpc_start_instant_meeting,
+    "join_meeting": _rpc_join_meeting,
+    "exit_meeting": _rpc_exit_meeting,
+}
+RPC_SIGNATURES = {name: inspect.signature(method) for name, method in RPC_METHODS.items()}
+
+
+def _rpc_error(request_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+async def _rpc_dispatch(call) -> Optional[dict]:
+    """Run one JSON-RPC call; None for a notification (a call without an id)"""
+    if not isinstance(call, dict):
+        return _rpc_error(None, RPC_INVALID_REQUEST, "Invalid Request")
+    request_id = call.get("id")
+    method = call.get("method")
+    params = call.get("params", {})
+    if call.get("jsonrpc") != "2.0" or not isinstance(method, str):
+        # Not a valid request, so never a notification: always answered
+        return _rpc_error(request_id, RPC_INVALID_REQUEST, "Invalid Request")
+    if method not in RPC_METHODS:
+        response = _rpc_error(request_id, RPC_METHOD_NOT_FOUND, f"Method not found: {method}")
+    elif not isinstance(params, dict):
+        response = _rpc_error(request_id, RPC_INVALID_PARAMS, "params must be an object")
+    else:
+        response = await _rpc_call(request_id, method, params)
+    return None if "id" not in call else response
+
+
+async def _rpc_call(request_id, method: str, params: dict) -> dict:
+    try:
+        bound = RPC_SIGNATURES[method].bind(**params)
+    except TypeError as e:
+        return _rpc_error(request_id, RPC_INVALID_PARAMS, str(e))
+    room_id = bound.arguments["room_id"]
+    if not isinstance(room_id, str):
+        return _rpc_error(request_id, RPC_INVALID_PARAMS, "room_id must be a string")
+    if room_id not in room_manager.rooms:
+        return _rpc_error(request_id, RPC_ROOM_NOT_FOUND, "Room not found")
+    try:
+        result = await RPC_METHODS[method](*bound.args, **bound.kwargs)
+    except Exception as e:
+        logger.error("RPC %s failed: %s", method, e)
+        return _rpc_error(request_id, RPC_INTERNAL_ERROR, str(e))
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+async def rpc(request: Request) -> Response:
+    """JSON-RPC 2.0 endpoint for the room commands in RPC_METHODS
+
+    Mounted as a plain Starlette route, so requests skip FastAPI's parameter
+    resolution and validation. A batch (JSON array) runs many commands in one
+    HTTP round trip and returns their responses in order.
+    """
+    try:
+        payload = json_loads(await request.body())
+    except ValueError:
+        return json_response(_rpc_error(None, RPC_PARSE_ERROR, "Parse error"))
+    if isinstance(payload, list):
+        if not payload:
+            return json_response(_rpc_error(None, RPC_INVALID_REQUEST, "Invalid Request"))
+        responses = await asyncio.gather(*map(_rpc_dispatch, payload))
+        content = [response for response in responses if response is not None]
+    else:
+        content = await _rpc_dispatch(payload)
+    if not content:
+        # Only notifications: nothing to answer
+        return Response(status_code=204)
+    return json_response(content)
+
+
+app.add_route("/rpc", rpc, methods=["POST"])
+
+
+@app.websocket("/api/rooms/{room_id}/events")
+async def room_events(websocket: WebSocket, room_id: str,
+                      binary: bool = False, batch: bool = False):
+    """Stream a room's SDK callbacks as JSON events
+
+    Events arrive as text frames; pass ?binary=true to get the same JSON as
+    binary frames, which skips a UTF-8 decode on both ends. Pass ?batch=true
+    to receive bursts as one {"events": [...]} frame per 15ms window.
+    Clients that offer the "msgpack" subprotocol get msgpack binary frames
+    instead of JSON, when msgpack is installed.
+
+    Clients aren't expected to send anything; one that floods the socket
+    past CLIENT_MESSAGE_RATE is closed with 1008 (policy violation).
+    """
+    use_msgpack = (msgpack is not None
+                   and MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", ()))
+    await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if use_msgpack else None)
+    room_manager.add_websocket(room_id, websocket, binary, batch, use_msgpack)
+    loop = asyncio.get_running_loop()
+    tokens, last = CLIENT_MESSAGE_BURST, loop.time()
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            now = loop.time()
+            tokens = min(CLIENT_MESSAGE_BURST, tokens + (now - last) * CLIENT_MESSAGE_RATE)
+            last = now
+            if tokens < 1:
+                logger.warning("[%s] Closing events socket flooding the service", room_id)
+                await websocket.close(code=1008)
+                break
+            tokens -= 1
+    except WebSocketDisconnect:
+        pass
+    finally:
+        room_manager.remove_websocket(room_id, websocket)
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "sdk_initialized": room_manager.sdk is not None,
-        "active_rooms": len(room_manager.rooms)
-    }
+    return Response(content=_health_body(len(room_manager.rooms), room_manager.sdk is not None),
+                    media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools come with uvicorn[standard]; name them so a missing
+    # one fails loudly instead of silently falling back to the pure-Python
+    # implementations. One worker: SDK state lives in this process, so more
+    # workers need their own SDK data and ZRC_EVENT_BUS_URL for shared events.
+    uvicorn.run(app, host="0.0.0.0", port=8000,
+                loop="uvloop", http="httptools", ws="websockets", workers=1)
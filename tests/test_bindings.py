@@ -0,0 +1,113 @@
+"""Check that both binding sources define every zrc_sdk name service/app.py uses
+
+The hand-written bindings/zrc_bindings.cpp and simple_generator.py's output
+(what update_sdk.sh builds) must stay interchangeable. This reads the C++
+sources rather than importing a built module, so it runs without the SDK.
+
+Run with: python -m unittest discover tests
+"""
+
+import ast
+import importlib.util
+import re
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APP = ROOT / 'service' / 'app.py'
+BINDINGS = ROOT / 'bindings'
+
+# Names placed on the module: functions, classes and exported enum values
+_MODULE_NAME = re.compile(
+    r'\bm\.def\("(\w+)"'
+    r'|nb::(?:class_|enum_)<[^>]+>\s*(?:\w+\s*)?\(m,\s*"(\w+)"'
+    r'|\.value\("(\w+)"'
+    r'|\{"(\w+)",\s*\w+::\w+\}'
+)
+# Methods bound on a class, one by one or through a bind_all-style fold
+_METHOD_NAME = re.compile(r'\.def(?:_static)?\("(\w+)"|std::pair\{"(\w+)"')
+
+
+def _bound_names(sources):
+    """(module-level names, method names) defined by the given C++ sources"""
+    module, methods = set(), set()
+    for source in sources:
+        for match in _MODULE_NAME.finditer(source):
+            module.add(next(filter(None, match.groups())))
+        for match in _METHOD_NAME.finditer(source):
+            methods.add(next(filter(None, match.groups())))
+    return module, methods
+
+
+def _app_names():
+    """(zrc_sdk.<name> reads, SDK method names called) in service/app.py
+
+    SDK methods are the CamelCase attributes not defined in app.py itself
+    and not read off another imported module.
+    """
+    tree = ast.parse(APP.read_text())
+    imported, defined = set(), set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imported.update((alias.asname or alias.name).split('.')[0] for alias in node.names)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            defined.add(node.name)
+    imported.discard('zrc_sdk')
+
+    module, methods = set(), set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Attribute) or not node.attr[:1].isupper():
+            continue
+        if isinstance(node.value, ast.Name) and node.value.id == 'zrc_sdk':
+            module.add(node.attr)
+            continue
+        root = node.value
+        while isinstance(root, (ast.Attribute, ast.Subscript, ast.Call)):
+            root = root.func if isinstance(root, ast.Call) else root.value
+        if getattr(root, 'id', None) not in imported and node.attr not in defined:
+            methods.add(node.attr)
+    return module, methods
+
+
+def _load_generator():
+    spec = importlib.util.spec_from_file_location(
+        'simple_generator', ROOT / 'generator' / 'simple_generator.py')
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+    return generator
+
+
+class BindingNamesTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app_module, cls.app_methods = _app_names()
+        cls.service = (BINDINGS / 'zrc_service.cpp').read_text()
+
+    def assertCoversApp(self, sources):
+        module, methods = _bound_names(sources)
+        self.assertEqual(self.app_module - module, set(), 'zrc_sdk names app.py reads')
+        self.assertEqual(self.app_methods - methods, set(), 'SDK methods app.py calls')
+
+    def test_app_uses_sdk_names(self):
+        # Guards the extraction itself: an empty set would pass trivially
+        self.assertIn('RegisterSDKSink', self.app_module)
+        self.assertIn('ExitMeetingCmdLeave', self.app_module)
+        # list_rooms' batch query, which the generated module used to lack
+        self.assertIn('GetConnectionStates', self.app_module)
+        self.assertIn('RegisterSink', self.app_methods)
+        self.assertIn('QueryAllZoomRoomsServices', self.app_methods)
+
+    def test_hand_written_bindings(self):
+        self.assertCoversApp([(BINDINGS / 'zrc_bindings.cpp').read_text(), self.service])
+
+    def test_generated_bindings(self):
+        generator = _load_generator()
+        names = generator.binding_order()
+        rendered = [generator.PCH_TEMPLATE, generator.render_main(names)]
+        rendered += map(generator.render_shard, names)
+        self.assertCoversApp(rendered + [self.service])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -32,11 +32,10 @@ echo -e "${GREEN}✓ SDK files found${NC}"
 echo ""
 
 # Step 2: Regenerate bindings
-echo -e "${BLUE}[2/4] Regenerating pybind11 bindings...${NC}"
+echo -e "${BLUE}[2/4] Regenerating nanobind bindings...${NC}"
 if [ ! -f ".venv/bin/python" ]; then
     echo -e "${YELLOW}Virtual environment not found, creating...${NC}"
     python3 -m venv .venv
-    .venv/bin/pip install -q jinja2
 fi
 .venv/bin/python generator/simple_generator.py
 echo -e "${GREEN}✓ Bindings regenerated${NC}"